@@ -257,11 +257,13 @@ func (a *App) startup(ctx context.Context) {
 	// Initialize PDF translator with config
 	pdfConfig := pdf.PDFTranslatorConfig{
 		Config: &types.Config{
-			OpenAIAPIKey:  apiKey,
-			OpenAIBaseURL: baseURL,
-			OpenAIModel:   model,
-			ContextWindow: a.config.GetContextWindow(),
-			Concurrency:   concurrency,
+			OpenAIAPIKey:   apiKey,
+			OpenAIBaseURL:  baseURL,
+			OpenAIModel:    model,
+			ContextWindow:  a.config.GetContextWindow(),
+			Concurrency:    concurrency,
+			ExtractWorkers: a.config.GetExtractWorkers(),
+			FinalDelivery:  a.config.GetFinalDelivery(),
 		},
 		WorkDir: a.workDir,
 	}
@@ -457,11 +459,13 @@ func (a *App) ReloadConfig() error {
 	// Update PDF translator with new config
 	if a.pdfTranslator != nil {
 		a.pdfTranslator.UpdateConfig(&types.Config{
-			OpenAIAPIKey:  apiKey,
-			OpenAIBaseURL: baseURL,
-			OpenAIModel:   model,
-			ContextWindow: a.config.GetContextWindow(),
-			Concurrency:   concurrency,
+			OpenAIAPIKey:   apiKey,
+			OpenAIBaseURL:  baseURL,
+			OpenAIModel:    model,
+			ContextWindow:  a.config.GetContextWindow(),
+			Concurrency:    concurrency,
+			ExtractWorkers: a.config.GetExtractWorkers(),
+			FinalDelivery:  a.config.GetFinalDelivery(),
 		})
 		// Also update work directory for PDF translator
 		if configWorkDir != "" {
@@ -500,6 +504,8 @@ func (a *App) applyLicenseLLMConfig() {
 	compiler := config.DefaultCompiler
 	workDir := ""
 	concurrency := config.DefaultConcurrency
+	extractWorkers := 1
+	finalDelivery := false
 	libraryPageSize := config.DefaultLibraryPageSize
 	sharePromptEnabled := true
 
@@ -508,6 +514,8 @@ func (a *App) applyLicenseLLMConfig() {
 		compiler = a.config.GetDefaultCompiler()
 		workDir = a.config.GetWorkDirectory()
 		concurrency = a.config.GetConcurrency()
+		extractWorkers = a.config.GetExtractWorkers()
+		finalDelivery = a.config.GetFinalDelivery()
 		libraryPageSize = a.config.GetLibraryPageSize()
 		// Get current share prompt setting from config
 		cfg := a.config.GetConfig()
@@ -557,11 +565,13 @@ func (a *App) applyLicenseLLMConfig() {
 	// Update PDF translator with new config
 	if a.pdfTranslator != nil {
 		a.pdfTranslator.UpdateConfig(&types.Config{
-			OpenAIAPIKey:  activationData.LLMAPIKey,
-			OpenAIBaseURL: effectiveBaseURL, // Use effective base URL
-			OpenAIModel:   activationData.LLMModel,
-			ContextWindow: contextWindow,
-			Concurrency:   concurrency,
+			OpenAIAPIKey:   activationData.LLMAPIKey,
+			OpenAIBaseURL:  effectiveBaseURL, // Use effective base URL
+			OpenAIModel:    activationData.LLMModel,
+			ContextWindow:  contextWindow,
+			Concurrency:    concurrency,
+			ExtractWorkers: extractWorkers,
+			FinalDelivery:  finalDelivery,
 		})
 	}
 
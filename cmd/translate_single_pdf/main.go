@@ -2,6 +2,7 @@ package main
 
 import (
 	"encoding/json"
+	"flag"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -11,12 +12,16 @@ import (
 )
 
 func main() {
-	if len(os.Args) < 2 {
-		fmt.Println("Usage: translate_single_pdf <input.pdf>")
+	workers := flag.Int("workers", 0, "parallel page extraction workers (default: extract_workers from config, else 1; max 4)")
+	finalDelivery := flag.Bool("final", false, "save the translated PDF with maximum compression (slower, smaller file)")
+	flag.Parse()
+
+	if flag.NArg() < 1 {
+		fmt.Println("Usage: translate_single_pdf [--workers N] [--final] <input.pdf>")
 		os.Exit(1)
 	}
 
-	inputPDF := os.Args[1]
+	inputPDF := flag.Arg(0)
 	if _, err := os.Stat(inputPDF); err != nil {
 		fmt.Printf("Error: PDF not found: %s\n", inputPDF)
 		os.Exit(1)
@@ -53,6 +58,9 @@ func main() {
 	if cfg.Concurrency == 0 {
 		cfg.Concurrency = 3
 	}
+	if *finalDelivery {
+		cfg.FinalDelivery = true
+	}
 
 	if cfg.OpenAIAPIKey == "" {
 		fmt.Println("Error: OpenAI API key not configured")
@@ -77,6 +85,7 @@ func main() {
 	translator := pdf.NewBabelDocPDFTranslator(pdf.BabelDocPDFTranslatorConfig{
 		Config:  cfg,
 		WorkDir: outputDir,
+		Workers: *workers,
 	})
 	defer translator.Close()
 
@@ -434,6 +434,21 @@ func (m *ConfigManager) GetConcurrency() int {
 	return DefaultConcurrency
 }
 
+// GetExtractWorkers returns the number of parallel page extraction workers for PDF translation.
+// Defaults to 1 (sequential extraction); values above pdf.MaxExtractWorkers are capped by the PDF package.
+func (m *ConfigManager) GetExtractWorkers() int {
+	if m.config != nil && m.config.ExtractWorkers > 0 {
+		return m.config.ExtractWorkers
+	}
+	return 1
+}
+
+// GetFinalDelivery reports whether translated PDFs are saved in final-delivery mode
+// (maximum compression: slower save, smaller file). Defaults to false.
+func (m *ConfigManager) GetFinalDelivery() bool {
+	return m.config != nil && m.config.FinalDelivery
+}
+
 // GetLibraryPageSize returns the number of papers to display per page in library browser
 func (m *ConfigManager) GetLibraryPageSize() int {
 	if m.config != nil && m.config.LibraryPageSize > 0 {
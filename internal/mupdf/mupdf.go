@@ -125,9 +125,19 @@ static char* extract_page_text(fz_context *ctx, fz_document *doc, int page_num)
 }
 
 // Helper to save PDF document
-static int save_pdf_document(fz_context *ctx, pdf_document *doc, const char *filename) {
+// New streams are always deflated. With incremental set, only changed objects are
+// appended to filename, which must be the file the document was opened from.
+static int save_pdf_document(fz_context *ctx, pdf_document *doc, const char *filename, int incremental) {
     fz_try(ctx) {
-        pdf_save_document(ctx, doc, filename, NULL);
+        pdf_write_options opts = pdf_default_write_options;
+        opts.do_compress = 1;
+        if (incremental && pdf_can_be_saved_incrementally(ctx, doc)) {
+            opts.do_incremental = 1;
+        } else {
+            // Full rewrite: drop objects no longer referenced
+            opts.do_garbage = 1;
+        }
+        pdf_save_document(ctx, doc, filename, &opts);
     }
     fz_catch(ctx) {
         return -1;
@@ -399,6 +409,54 @@ static int add_rect_to_page(fz_context *ctx, pdf_document *doc, int page_num,
     return 0;
 }
 
+// Helper to add many rectangles to a page in a single content stream
+// rects holds count x, y, w, h quadruples; the page is loaded once
+static int add_rects_to_page(fz_context *ctx, pdf_document *doc, int page_num,
+                             const float *rects, int count,
+                             float r, float g, float b) {
+    fz_try(ctx) {
+        pdf_page *page = pdf_load_page(ctx, doc, page_num);
+        
+        // One content stream for all rectangles
+        fz_buffer *buf = fz_new_buffer(ctx, 64 + count * 48);
+        fz_append_printf(ctx, buf, "q\n");
+        fz_append_printf(ctx, buf, "%.3f %.3f %.3f rg\n", r, g, b);
+        for (int i = 0; i < count; i++) {
+            const float *rect = rects + i * 4;
+            fz_append_printf(ctx, buf, "%.2f %.2f %.2f %.2f re\n", rect[0], rect[1], rect[2], rect[3]);
+        }
+        fz_append_printf(ctx, buf, "f\n");
+        fz_append_printf(ctx, buf, "Q\n");
+        
+        // Add content to page (prepend to draw under text)
+        pdf_obj *contents = pdf_add_stream(ctx, doc, buf, NULL, 0);
+        pdf_obj *old_contents = pdf_dict_get(ctx, page->obj, PDF_NAME(Contents));
+        
+        pdf_obj *arr = pdf_new_array(ctx, doc, 2);
+        pdf_array_push(ctx, arr, contents);  // Rectangles first (background)
+        
+        if (old_contents) {
+            if (pdf_is_array(ctx, old_contents)) {
+                int n = pdf_array_len(ctx, old_contents);
+                for (int i = 0; i < n; i++) {
+                    pdf_array_push(ctx, arr, pdf_array_get(ctx, old_contents, i));
+                }
+            } else {
+                pdf_array_push(ctx, arr, old_contents);
+            }
+        }
+        
+        pdf_dict_put(ctx, page->obj, PDF_NAME(Contents), arr);
+        
+        fz_drop_buffer(ctx, buf);
+        fz_drop_page(ctx, (fz_page*)page);
+    }
+    fz_catch(ctx) {
+        return -1;
+    }
+    return 0;
+}
+
 */
 import "C"
 
@@ -523,12 +581,28 @@ func (d *PDFDocument) PageCount() int {
 	return int(C.pdf_count_pages(d.ctx.ctx, d.doc))
 }
 
-// Save saves the PDF document to a file
+// Save saves the PDF document to a file, rewriting the whole document
 func (d *PDFDocument) Save(filename string) error {
+	return d.save(filename, false)
+}
+
+// SaveIncremental appends only the changed objects to filename, which must be
+// the file the document was opened from. Unchanged pages are not rewritten.
+// Falls back to a full rewrite if the document cannot be saved incrementally
+// (e.g. it was repaired on load).
+func (d *PDFDocument) SaveIncremental(filename string) error {
+	return d.save(filename, true)
+}
+
+func (d *PDFDocument) save(filename string, incremental bool) error {
 	cFilename := C.CString(filename)
 	defer C.free(unsafe.Pointer(cFilename))
 
-	if C.save_pdf_document(d.ctx.ctx, d.doc, cFilename) != 0 {
+	cIncremental := C.int(0)
+	if incremental {
+		cIncremental = 1
+	}
+	if C.save_pdf_document(d.ctx.ctx, d.doc, cFilename, cIncremental) != 0 {
 		return ErrSaveDocument
 	}
 	return nil
@@ -566,6 +640,32 @@ func (d *PDFDocument) AddRect(pageNum int, x, y, w, h float64, r, g, b float64)
 	return nil
 }
 
+// Rect is a rectangle on a page
+type Rect struct {
+	X, Y, W, H float64
+}
+
+// AddRects adds filled rectangles to a page in a single content stream.
+// Prefer it over calling AddRect per block: the page is loaded once and only
+// one content stream is added.
+func (d *PDFDocument) AddRects(pageNum int, rects []Rect, r, g, b float64) error {
+	if len(rects) == 0 {
+		return nil
+	}
+
+	coords := make([]C.float, 0, len(rects)*4)
+	for _, rect := range rects {
+		coords = append(coords, C.float(rect.X), C.float(rect.Y), C.float(rect.W), C.float(rect.H))
+	}
+
+	if C.add_rects_to_page(d.ctx.ctx, d.doc, C.int(pageNum),
+		&coords[0], C.int(len(rects)),
+		C.float(r), C.float(g), C.float(b)) != 0 {
+		return ErrAddText
+	}
+	return nil
+}
+
 // TextBlock represents extracted text with position
 type TextBlock struct {
 	Text     string
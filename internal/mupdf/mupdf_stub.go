@@ -76,6 +76,11 @@ func (d *PDFDocument) Save(filename string) error {
 	return ErrNotAvailable
 }
 
+// SaveIncremental appends the changed objects to the opened file (stub)
+func (d *PDFDocument) SaveIncremental(filename string) error {
+	return ErrNotAvailable
+}
+
 // AddText adds text to a page at the specified position (stub)
 func (d *PDFDocument) AddText(pageNum int, text string, x, y, fontSize float64, fontName string) error {
 	return ErrNotAvailable
@@ -86,6 +91,16 @@ func (d *PDFDocument) AddRect(pageNum int, x, y, w, h float64, r, g, b float64)
 	return ErrNotAvailable
 }
 
+// Rect is a rectangle on a page
+type Rect struct {
+	X, Y, W, H float64
+}
+
+// AddRects adds filled rectangles to a page in a single content stream (stub)
+func (d *PDFDocument) AddRects(pageNum int, rects []Rect, r, g, b float64) error {
+	return ErrNotAvailable
+}
+
 // CoverAndAddText covers original text with white rectangle and adds translated text (stub)
 func (d *PDFDocument) CoverAndAddText(pageNum int, x, y, w, h float64, translatedText string, fontSize float64) error {
 	return ErrNotAvailable
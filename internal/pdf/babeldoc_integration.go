@@ -30,6 +30,20 @@ type BabelDocPDFTranslatorConfig struct {
 	WorkDir   string
 	CachePath string
 	FontPath  string // Optional: path to Chinese font
+	Workers   int    // Optional: parallel page extraction workers (default Config.ExtractWorkers, else 1)
+}
+
+// configExtractWorkers returns the ExtractWorkers setting of cfg, 0 if cfg is nil
+func configExtractWorkers(cfg *types.Config) int {
+	if cfg == nil {
+		return 0
+	}
+	return cfg.ExtractWorkers
+}
+
+// configFinalDelivery returns the FinalDelivery setting of cfg, false if cfg is nil
+func configFinalDelivery(cfg *types.Config) bool {
+	return cfg != nil && cfg.FinalDelivery
 }
 
 // NewBabelDocPDFTranslator creates a new BabelDOC-style PDF translator
@@ -46,10 +60,17 @@ func NewBabelDocPDFTranslator(cfg BabelDocPDFTranslatorConfig) *BabelDocPDFTrans
 		cachePath = workDir + "/babeldoc_cache.json"
 	}
 
+	workers := cfg.Workers
+	if workers == 0 {
+		workers = configExtractWorkers(cfg.Config)
+	}
+
 	// Create BabelDoc translator
 	translator := NewBabelDocTranslator(BabelDocConfig{
-		WorkDir:  workDir,
-		FontPath: cfg.FontPath,
+		WorkDir:       workDir,
+		FontPath:      cfg.FontPath,
+		Workers:       workers,
+		FinalDelivery: configFinalDelivery(cfg.Config),
 	})
 
 	// Create batch translator for API calls
@@ -137,42 +158,45 @@ func (t *BabelDocPDFTranslator) TranslatePDF(inputPath, outputPath string, progr
 	translatedCount := 0
 	cachedCount := 0
 
+	// Pass 1: serve cache hits, collect cache misses
+	var uncachedBlocks []TextBlock
 	for _, block := range translatableBlocks {
-		text := block.Text
-
-		// Check cache first
-		if cached, ok := t.cache.Get(text); ok && cached != "" {
+		if cached, ok := t.cache.Get(block.Text); ok && cached != "" {
 			translations[block.ID] = cached
 			cachedCount++
 			translatedCount++
 			continue
 		}
+		uncachedBlocks = append(uncachedBlocks, TextBlock{
+			ID:   block.ID,
+			Text: block.Text,
+		})
+	}
 
-		// Translate via API
-		if t.batchTranslator != nil {
-			textBlock := TextBlock{
-				ID:   block.ID,
-				Text: text,
-			}
-
-			translated, err := t.batchTranslator.TranslateBatch([]TextBlock{textBlock})
-			if err != nil {
-				logger.Warn("translation failed for block", logger.String("id", block.ID), logger.Err(err))
-				continue
-			}
+	// Pass 2: translate all misses together, merged into batches by context window
+	if len(uncachedBlocks) > 0 && t.batchTranslator != nil {
+		translated, err := t.batchTranslator.TranslateWithRetryAndProgress(
+			uncachedBlocks,
+			DefaultMaxRetries,
+			func(completed, total int) {
+				if progressCallback != nil && translatableCount > 0 {
+					progress := 20 + ((cachedCount + completed) * 60 / translatableCount)
+					progressCallback("translating", progress)
+				}
+			},
+		)
+		if err != nil {
+			// Failed batches come back with empty translations, the other blocks are still used
+			logger.Warn("batch translation had errors, keeping the translated blocks", logger.Err(err))
+		}
 
-			if len(translated) > 0 && translated[0].TranslatedText != "" {
-				translations[block.ID] = translated[0].TranslatedText
-				t.cache.Set(text, translated[0].TranslatedText)
+		for _, tb := range translated {
+			if tb.TranslatedText != "" {
+				translations[tb.ID] = tb.TranslatedText
+				t.cache.Set(tb.Text, tb.TranslatedText)
 				translatedCount++
 			}
 		}
-
-		// Update progress
-		if progressCallback != nil && translatableCount > 0 {
-			progress := 20 + (translatedCount * 60 / translatableCount)
-			progressCallback("translating", progress)
-		}
 	}
 
 	// Save cache
@@ -8,6 +8,8 @@ import (
 	"path/filepath"
 	"sort"
 	"strings"
+	"sync"
+	"unicode/utf8"
 
 	"github.com/ledongthuc/pdf"
 	"github.com/pdfcpu/pdfcpu/pkg/api"
@@ -26,15 +28,24 @@ import (
 // 3. Translation: Call LLM API to translate text
 // 4. PDF Generation: Overlay translated text on original PDF
 type BabelDocTranslator struct {
-	workDir    string
-	fontPath   string // Path to Chinese font (TTF/OTF)
-	conf       *model.Configuration
+	workDir       string
+	fontPath      string // Path to Chinese font (TTF/OTF)
+	workers       int    // Number of parallel page extraction workers
+	finalDelivery bool   // Write the overlay PDF with maximum compression
+	conf          *model.Configuration
 }
 
+// MaxExtractWorkers caps the number of parallel page extraction workers.
+// Page parsing is CPU bound, more workers than this rarely pay off.
+const MaxExtractWorkers = 4
+
 // BabelDocConfig holds configuration for BabelDocTranslator
 type BabelDocConfig struct {
 	WorkDir  string
 	FontPath string // Optional: path to Chinese font for better rendering
+	Workers  int    // Optional: parallel page extraction workers (default 1, max MaxExtractWorkers)
+	// Optional: compress the generated PDF as much as possible (slower save, smaller file)
+	FinalDelivery bool
 }
 
 // NewBabelDocTranslator creates a new BabelDOC-style translator
@@ -45,10 +56,25 @@ func NewBabelDocTranslator(cfg BabelDocConfig) *BabelDocTranslator {
 	}
 
 	return &BabelDocTranslator{
-		workDir:  workDir,
-		fontPath: cfg.FontPath,
-		conf:     model.NewDefaultConfiguration(),
+		workDir:       workDir,
+		fontPath:      cfg.FontPath,
+		workers:       extractWorkerCount(cfg.Workers),
+		finalDelivery: cfg.FinalDelivery,
+		conf:          model.NewDefaultConfiguration(),
+	}
+}
+
+// extractWorkerCount clamps a configured number of page extraction workers
+// to [1, MaxExtractWorkers]; 0 (not configured) means sequential extraction.
+// Shared by the ledongthuc/pdf and MuPDF extraction paths.
+func extractWorkerCount(workers int) int {
+	if workers < 1 {
+		return 1
+	}
+	if workers > MaxExtractWorkers {
+		return MaxExtractWorkers
 	}
+	return workers
 }
 
 // BabelDocBlock represents a text block extracted from PDF (similar to BabelDOC's IL)
@@ -89,21 +115,28 @@ type TranslatedBabelDocBlock struct {
 // This is similar to BabelDOC's PDF parsing stage.
 // It will use MuPDF if available, otherwise falls back to ledongthuc/pdf.
 func (t *BabelDocTranslator) ExtractBlocks(pdfPath string) ([]BabelDocBlock, error) {
+	blocks, _, err := t.extractBlocks(pdfPath)
+	return blocks, err
+}
+
+// extractBlocks is ExtractBlocks that also returns the page count of the PDF,
+// so callers do not need to open the file again just to count pages.
+func (t *BabelDocTranslator) extractBlocks(pdfPath string) ([]BabelDocBlock, int, error) {
 	logger.Info("extracting blocks from PDF (BabelDOC style)",
 		logger.String("path", pdfPath))
 
 	// Check if file exists
 	if _, err := os.Stat(pdfPath); err != nil {
 		if os.IsNotExist(err) {
-			return nil, NewPDFError(ErrPDFNotFound, "PDF file not found", err)
+			return nil, 0, NewPDFError(ErrPDFNotFound, "PDF file not found", err)
 		}
-		return nil, NewPDFError(ErrPDFInvalid, "cannot access PDF file", err)
+		return nil, 0, NewPDFError(ErrPDFInvalid, "cannot access PDF file", err)
 	}
 
 	// Try MuPDF first if available (more accurate extraction)
 	if IsMuPDFAvailable() {
 		logger.Info("using MuPDF for text extraction")
-		textBlocks, err := ExtractTextBlocksWithMuPDF(pdfPath)
+		textBlocks, pageCount, err := extractTextBlocksWithMuPDF(pdfPath, t.workers)
 		if err == nil && len(textBlocks) > 0 {
 			// Convert TextBlock to BabelDocBlock
 			blocks := make([]BabelDocBlock, len(textBlocks))
@@ -125,7 +158,7 @@ func (t *BabelDocTranslator) ExtractBlocks(pdfPath string) ([]BabelDocBlock, err
 			}
 			logger.Info("extracted blocks with MuPDF",
 				logger.Int("totalBlocks", len(blocks)))
-			return blocks, nil
+			return blocks, pageCount, nil
 		}
 		logger.Warn("MuPDF extraction failed, falling back to ledongthuc/pdf",
 			logger.Err(err))
@@ -135,64 +168,63 @@ func (t *BabelDocTranslator) ExtractBlocks(pdfPath string) ([]BabelDocBlock, err
 	return t.extractBlocksWithLedongthuc(pdfPath)
 }
 
-// extractBlocksWithLedongthuc extracts blocks using ledongthuc/pdf library
-func (t *BabelDocTranslator) extractBlocksWithLedongthuc(pdfPath string) ([]BabelDocBlock, error) {
+// extractBlocksWithLedongthuc extracts blocks using ledongthuc/pdf library.
+// Pages are parsed by up to t.workers goroutines, each with its own reader.
+func (t *BabelDocTranslator) extractBlocksWithLedongthuc(pdfPath string) ([]BabelDocBlock, int, error) {
 	// Open PDF using ledongthuc/pdf
 	f, r, err := pdf.Open(pdfPath)
 	if err != nil {
-		return nil, NewPDFError(ErrPDFInvalid, "cannot open PDF file", err)
+		return nil, 0, NewPDFError(ErrPDFInvalid, "cannot open PDF file", err)
 	}
 	defer f.Close()
 
-	var blocks []BabelDocBlock
-	blockID := 0
-
 	totalPages := r.NumPage()
-	for pageNum := 1; pageNum <= totalPages; pageNum++ {
-		page := r.Page(pageNum)
-		if page.V.IsNull() {
-			continue
-		}
 
-		// Try GetTextByRow first (works well for most PDFs)
-		rows, err := page.GetTextByRow()
+	// 每页的结果单独存放，最后按页码顺序合并
+	pageResults := make([][]BabelDocBlock, totalPages)
+
+	// pdf.Reader is not safe for concurrent use, so every worker gets its own reader.
+	// The already opened reader is used by the first worker.
+	readers := []*pdf.Reader{r}
+	for len(readers) < t.workers && len(readers) < totalPages {
+		wf, wr, err := pdf.Open(pdfPath)
 		if err != nil {
-			logger.Warn("failed to get text from page",
-				logger.Int("page", pageNum),
+			logger.Warn("failed to open PDF for extraction worker",
 				logger.Err(err))
-			continue
+			break
 		}
+		defer wf.Close()
+		readers = append(readers, wr)
+	}
+	workers := len(readers)
 
-		// Check if row extraction gives good position data
-		hasGoodPositions := false
-		for _, row := range rows {
-			for _, text := range row.Content {
-				if text.X > 0 || text.Y > 0 {
-					hasGoodPositions = true
-					break
-				}
-			}
-			if hasGoodPositions {
-				break
-			}
+	if workers == 1 {
+		for pageNum := 1; pageNum <= totalPages; pageNum++ {
+			pageResults[pageNum-1] = t.extractPageBlocks(r.Page(pageNum), pageNum)
 		}
-
-		if hasGoodPositions {
-			// Use row-based extraction
-			for _, row := range rows {
-				if len(row.Content) == 0 {
-					continue
-				}
-				block := t.processRow(row, pageNum, &blockID)
-				if block != nil {
-					blocks = append(blocks, *block)
+	} else {
+		pages := make(chan int, totalPages)
+		for pageNum := 1; pageNum <= totalPages; pageNum++ {
+			pages <- pageNum
+		}
+		close(pages)
+
+		var wg sync.WaitGroup
+		for _, wr := range readers {
+			wg.Add(1)
+			go func(wr *pdf.Reader) {
+				defer wg.Done()
+				for pageNum := range pages {
+					pageResults[pageNum-1] = t.extractPageBlocks(wr.Page(pageNum), pageNum)
 				}
-			}
-		} else {
-			// Fallback: extract text and create synthetic blocks
-			pageBlocks := t.extractBlocksFromPageContent(page, pageNum, &blockID)
-			blocks = append(blocks, pageBlocks...)
+			}(wr)
 		}
+		wg.Wait()
+	}
+
+	var blocks []BabelDocBlock
+	for _, pageBlocks := range pageResults {
+		blocks = append(blocks, pageBlocks...)
 	}
 
 	// Sort blocks by page and reading order
@@ -205,9 +237,61 @@ func (t *BabelDocTranslator) extractBlocksWithLedongthuc(pdfPath string) ([]Babe
 
 	logger.Info("extracted blocks from PDF",
 		logger.Int("totalBlocks", len(blocks)),
-		logger.Int("totalPages", totalPages))
+		logger.Int("totalPages", totalPages),
+		logger.Int("workers", workers))
 
-	return blocks, nil
+	return blocks, totalPages, nil
+}
+
+// extractPageBlocks extracts the blocks of a single page
+func (t *BabelDocTranslator) extractPageBlocks(page pdf.Page, pageNum int) []BabelDocBlock {
+	if page.V.IsNull() {
+		return nil
+	}
+
+	// Block IDs are only unique per page here, they are re-assigned after sorting
+	blockID := 0
+
+	// Try GetTextByRow first (works well for most PDFs)
+	rows, err := page.GetTextByRow()
+	if err != nil {
+		logger.Warn("failed to get text from page",
+			logger.Int("page", pageNum),
+			logger.Err(err))
+		return nil
+	}
+
+	// Check if row extraction gives good position data
+	hasGoodPositions := false
+	for _, row := range rows {
+		for _, text := range row.Content {
+			if text.X > 0 || text.Y > 0 {
+				hasGoodPositions = true
+				break
+			}
+		}
+		if hasGoodPositions {
+			break
+		}
+	}
+
+	if !hasGoodPositions {
+		// Fallback: extract text and create synthetic blocks
+		return t.extractBlocksFromPageContent(page, pageNum, &blockID)
+	}
+
+	// Use row-based extraction
+	var blocks []BabelDocBlock
+	for _, row := range rows {
+		if len(row.Content) == 0 {
+			continue
+		}
+		block := t.processRow(row, pageNum, &blockID)
+		if block != nil {
+			blocks = append(blocks, *block)
+		}
+	}
+	return blocks
 }
 
 // extractBlocksFromPageContent extracts blocks by parsing page content directly
@@ -350,30 +434,23 @@ func (t *BabelDocTranslator) processRow(row *pdf.Row, pageNum int, blockID *int)
 	var totalFontSize float64
 	var fontName string
 	var isBold, isItalic bool
-	var chars []CharInfo
 	first := true
 
-	// First pass: collect all non-empty text fragments
-	var fragments []string
-	for _, text := range row.Content {
-		if text.S == "" {
-			continue
-		}
-		if t.isPostScriptCode(text.S) {
-			continue
-		}
-		fragments = append(fragments, text.S)
-	}
-
-	// Second pass: join fragments with smart spacing.
+	// Single pass over the row: join the text fragments and collect positions, font and style.
 	// ledongthuc/pdf splits text at font/encoding boundaries (ligatures like fi, fl, ff).
 	// Since we can't reliably distinguish ligature splits from word boundaries
 	// without actual X position data, we add spaces between all fragments.
 	// The LLM translator can handle minor spacing artifacts like "Lar ge" or "v arious".
 	var textBuilder strings.Builder
-	for i, frag := range fragments {
-		if i > 0 && textBuilder.Len() > 0 {
-			prev := fragments[i-1]
+	prev := ""
+	fragmentCount := 0
+	for _, text := range row.Content {
+		if text.S == "" || t.isPostScriptCode(text.S) {
+			continue
+		}
+		frag := text.S
+
+		if fragmentCount > 0 && textBuilder.Len() > 0 {
 			// Only skip space for clear ligature/encoding patterns:
 			skipSpace := false
 			// 1-char fragment that's a letter (ligature split or small-caps encoding)
@@ -400,13 +477,8 @@ func (t *BabelDocTranslator) processRow(row *pdf.Row, pageNum int, blockID *int)
 			}
 		}
 		textBuilder.WriteString(frag)
-	}
-
-	// Track positions from row content
-	for _, text := range row.Content {
-		if text.S == "" || t.isPostScriptCode(text.S) {
-			continue
-		}
+		prev = frag
+		fragmentCount++
 
 		// Track position bounds
 		if first {
@@ -431,18 +503,9 @@ func (t *BabelDocTranslator) processRow(row *pdf.Row, pageNum int, blockID *int)
 			}
 		}
 
+		// Running sum, the average is taken once after the loop
 		totalFontSize += text.FontSize
 
-		// Collect character info
-		for _, ch := range text.S {
-			chars = append(chars, CharInfo{
-				Char:     ch,
-				X:        text.X,
-				Y:        text.Y,
-				FontSize: text.FontSize,
-			})
-		}
-
 		// Detect bold/italic from font name
 		fontLower := strings.ToLower(text.Font)
 		if strings.Contains(fontLower, "bold") {
@@ -463,8 +526,8 @@ func (t *BabelDocTranslator) processRow(row *pdf.Row, pageNum int, blockID *int)
 		return nil
 	}
 
-	// Calculate average font size
-	avgFontSize := totalFontSize / float64(len(row.Content))
+	// Calculate average font size over the fragments that were used
+	avgFontSize := totalFontSize / float64(fragmentCount)
 	if avgFontSize <= 0 {
 		avgFontSize = 10.0
 	}
@@ -520,7 +583,6 @@ func (t *BabelDocTranslator) processRow(row *pdf.Row, pageNum int, blockID *int)
 		IsItalic:   isItalic,
 		BlockType:  blockType,
 		LineHeight: avgFontSize * 1.2,
-		Chars:      chars,
 	}
 }
 
@@ -539,6 +601,16 @@ func (t *BabelDocTranslator) sortBlocksByReadingOrder(blocks []BabelDocBlock) {
 	})
 }
 
+// newGoPDF2Generator creates the GoPDF2 overlay generator with the translator's font and compression settings
+func (t *BabelDocTranslator) newGoPDF2Generator() *GoPDF2Generator {
+	gen := NewGoPDF2Generator(t.workDir)
+	if t.fontPath != "" {
+		gen.fontPath = t.fontPath
+	}
+	gen.SetCompressLevel(overlayCompressLevel(t.finalDelivery))
+	return gen
+}
+
 // GenerateTranslatedPDF generates a PDF with translated text overlaid on the original.
 // Priority: 1. GoPDF2 overlay (best quality), 2. pdfcpu stamps (fallback)
 func (t *BabelDocTranslator) GenerateTranslatedPDF(originalPath string, blocks []TranslatedBabelDocBlock, outputPath string) error {
@@ -584,11 +656,6 @@ func (t *BabelDocTranslator) GenerateTranslatedPDF(originalPath string, blocks [
 
 	// Method 2: Fallback to pdfcpu stamps
 	fmt.Println("回退到 pdfcpu stamp 方法...")
-	
-	// Copy original to output first
-	if err := t.copyFile(originalPath, outputPath); err != nil {
-		return NewPDFError(ErrGenerateFailed, "cannot copy original PDF", err)
-	}
 
 	// Group blocks by page
 	pageBlocks := t.groupBlocksByPage(blocks)
@@ -599,15 +666,33 @@ func (t *BabelDocTranslator) GenerateTranslatedPDF(originalPath string, blocks [
 		logger.Warn("cannot get page info, using A4 defaults", logger.Err(err))
 	}
 
-	// Apply stamps for each page
+	// Build the stamps of all pages first, then write them in a single pass
+	// (one read of the original and one write of the output, instead of a rewrite per block)
+	stamps := make(map[int][]*model.Watermark, len(pageBlocks))
 	for pageNum, pageBlockList := range pageBlocks {
-		if err := t.applyPageStamps(outputPath, pageNum, pageBlockList, pageInfo); err != nil {
-			logger.Warn("failed to apply stamps to page",
-				logger.Int("page", pageNum),
-				logger.Err(err))
+		if pageStamps := t.buildPageStamps(pageNum, pageBlockList, pageInfo); len(pageStamps) > 0 {
+			stamps[pageNum] = pageStamps
 		}
 	}
 
+	stamped := false
+	if len(stamps) > 0 {
+		if err := api.AddWatermarksSliceMapFile(originalPath, outputPath, stamps, nil); err != nil {
+			logger.Warn("failed to add stamps in one pass, stamping page by page", logger.Err(err))
+		} else {
+			stamped = true
+		}
+	}
+
+	// Start from a copy of the original, and if the single pass failed,
+	// stamp it page by page so one bad stamp only loses its own page or block
+	if !stamped {
+		if err := t.copyFile(originalPath, outputPath); err != nil {
+			return NewPDFError(ErrGenerateFailed, "cannot copy original PDF", err)
+		}
+		t.applyStampsByPage(outputPath, stamps)
+	}
+
 	// Verify output
 	fileInfo, err := os.Stat(outputPath)
 	if err != nil || fileInfo.Size() == 0 {
@@ -645,14 +730,39 @@ func (t *BabelDocTranslator) getPageInfo(pdfPath string) (map[int]PageInfo, erro
 	return pageInfo, nil
 }
 
-// applyPageStamps applies text stamps to a specific page
-func (t *BabelDocTranslator) applyPageStamps(pdfPath string, pageNum int, blocks []TranslatedBabelDocBlock, pageInfo map[int]PageInfo) error {
+// applyStampsByPage writes the stamps into pdfPath one page at a time.
+// A page whose stamps cannot be written together is retried block by block.
+func (t *BabelDocTranslator) applyStampsByPage(pdfPath string, stamps map[int][]*model.Watermark) {
+	for pageNum, pageStamps := range stamps {
+		pageMap := map[int][]*model.Watermark{pageNum: pageStamps}
+		err := api.AddWatermarksSliceMapFile(pdfPath, "", pageMap, nil)
+		if err == nil {
+			continue
+		}
+		logger.Warn("failed to add stamps to page, stamping block by block",
+			logger.Int("page", pageNum),
+			logger.Err(err))
+
+		pageSelection := []string{fmt.Sprintf("%d", pageNum)}
+		for _, wm := range pageStamps {
+			if err := api.AddWatermarksFile(pdfPath, "", pageSelection, wm, nil); err != nil {
+				logger.Warn("failed to add watermark",
+					logger.Int("page", pageNum),
+					logger.Err(err))
+			}
+		}
+	}
+}
+
+// buildPageStamps creates the text stamps for the blocks of a specific page
+func (t *BabelDocTranslator) buildPageStamps(pageNum int, blocks []TranslatedBabelDocBlock, pageInfo map[int]PageInfo) []*model.Watermark {
 	// Get page dimensions
 	info, ok := pageInfo[pageNum]
 	if !ok {
 		info = PageInfo{Width: 595.276, Height: 841.890}
 	}
 
+	var stamps []*model.Watermark
 	for _, block := range blocks {
 		if block.TranslatedText == "" || block.BlockType == "formula" {
 			continue
@@ -661,8 +771,6 @@ func (t *BabelDocTranslator) applyPageStamps(pdfPath string, pageNum int, blocks
 		// Create stamp description for this block
 		stampDesc := t.createStampDescription(block, info)
 
-		// Apply stamp using pdfcpu
-		pageSelection := []string{fmt.Sprintf("%d", pageNum)}
 		wm, err := api.TextWatermark(block.TranslatedText, stampDesc, true, false, pdftypes.POINTS)
 		if err != nil {
 			logger.Warn("failed to create watermark",
@@ -670,15 +778,10 @@ func (t *BabelDocTranslator) applyPageStamps(pdfPath string, pageNum int, blocks
 				logger.Err(err))
 			continue
 		}
-
-		if err := api.AddWatermarksFile(pdfPath, "", pageSelection, wm, nil); err != nil {
-			logger.Warn("failed to add watermark",
-				logger.Int("page", pageNum),
-				logger.Err(err))
-		}
+		stamps = append(stamps, wm)
 	}
 
-	return nil
+	return stamps
 }
 
 // createStampDescription creates pdfcpu stamp description string
@@ -712,12 +815,7 @@ func (t *BabelDocTranslator) adjustFontSizeForChinese(text string, originalSize,
 	// Chinese characters are typically wider than Latin characters
 	// Adjust font size to fit within the original width
 
-	chineseCount := 0
-	for _, r := range text {
-		if r >= 0x4E00 && r <= 0x9FFF {
-			chineseCount++
-		}
-	}
+	chineseCount := countCJKIdeographs(text)
 
 	if chineseCount == 0 {
 		return originalSize
@@ -775,25 +873,42 @@ func (t *BabelDocTranslator) determineBlockType(text string, fontSize float64, i
 
 // isMathFormula checks if text is a mathematical formula
 func (t *BabelDocTranslator) isMathFormula(text string) bool {
-	mathSymbols := "∫∑∏√∂∇±×÷≤≥≠≈∞∈∉⊂⊃∪∩∧∨¬∀∃αβγδεζηθικλμνξοπρστυφχψω²³⁰¹⁴⁵⁶⁷⁸⁹₀₁₂₃₄₅₆₇₈₉"
-
 	mathCount := 0
+	letterCount := 0
 	total := 0
 	hasEquals := false
 	hasParens := false
-	
+	hasStrongSymbol := false
+	hasScriptDigit := false
+
+	// Single pass: ASCII runes are classified directly, the symbol sets are only
+	// consulted for non-ASCII runes
 	for _, r := range text {
 		total++
-		if strings.ContainsRune(mathSymbols, r) ||
-			r == '+' || r == '-' || r == '*' || r == '/' ||
-			r == '=' || r == '<' || r == '>' || r == '^' || r == '_' {
-			mathCount++
+		if r < utf8.RuneSelf {
+			switch r {
+			case '=':
+				hasEquals = true
+				mathCount++
+			case '+', '-', '*', '/', '<', '>', '^', '_':
+				mathCount++
+			case '(', ')':
+				hasParens = true
+			default:
+				if (r >= 'a' && r <= 'z') || (r >= 'A' && r <= 'Z') {
+					letterCount++
+				}
+			}
+			continue
 		}
-		if r == '=' {
-			hasEquals = true
+		if strongMathSymbolSet[r] {
+			hasStrongSymbol = true
 		}
-		if r == '(' || r == ')' {
-			hasParens = true
+		if scriptDigitSet[r] {
+			hasScriptDigit = true
+			mathCount++
+		} else if mathSymbolSet[r] {
+			mathCount++
 		}
 	}
 
@@ -803,24 +918,17 @@ func (t *BabelDocTranslator) isMathFormula(text string) bool {
 	}
 
 	// Check for common formula patterns
-	if strings.ContainsAny(text, "∫∑∏√∂∇") {
+	if hasStrongSymbol {
 		return true
 	}
 
 	// Check for superscript/subscript patterns (like x² or E=mc²)
-	if strings.ContainsAny(text, "²³⁰¹⁴⁵⁶⁷⁸⁹₀₁₂₃₄₅₆₇₈₉") {
+	if hasScriptDigit {
 		return true
 	}
 
 	// Pattern like "f(x) = ..." - function notation with equals
 	if hasEquals && hasParens && len(text) < 50 {
-		// Count letters vs operators
-		letterCount := 0
-		for _, r := range text {
-			if (r >= 'a' && r <= 'z') || (r >= 'A' && r <= 'Z') {
-				letterCount++
-			}
-		}
 		// If mostly single letters with operators, likely a formula
 		if letterCount < 10 && mathCount > 2 {
 			return true
@@ -873,18 +981,28 @@ func (t *BabelDocTranslator) isHeading(text string, fontSize float64, isBold boo
 	return false
 }
 
+// captionPrefixes are the (lower case) prefixes that mark a caption
+var captionPrefixes = []string{"figure", "table", "fig.", "tab.", "图", "表"}
+
 // isCaption checks if text is a caption
 func (t *BabelDocTranslator) isCaption(text string) bool {
-	textLower := strings.ToLower(text)
-	prefixes := []string{"figure", "table", "fig.", "tab.", "图", "表"}
-	for _, prefix := range prefixes {
-		if strings.HasPrefix(textLower, prefix) {
+	for _, prefix := range captionPrefixes {
+		if hasPrefixFold(text, prefix) {
 			return true
 		}
 	}
 	return false
 }
 
+// commonTwoLetterWords are common 2-letter words that should NOT be joined to the next fragment
+var commonTwoLetterWords = map[string]bool{
+	"an": true, "as": true, "at": true, "be": true, "by": true,
+	"do": true, "go": true, "he": true, "if": true, "in": true,
+	"is": true, "it": true, "me": true, "my": true, "no": true,
+	"of": true, "on": true, "or": true, "so": true, "to": true,
+	"up": true, "us": true, "we": true,
+}
+
 // isWordBoundary determines if two adjacent text fragments should have a space between them.
 // ledongthuc/pdf splits text at font/encoding boundaries (e.g., ligatures fi, fl, ff, ffi).
 // Examples of ligature splits: "v"+"arious"="various", "e"+"ven"="even", "Ho"+"we"+"v"+"er"
@@ -934,15 +1052,7 @@ func (t *BabelDocTranslator) isWordBoundary(prev, curr string) bool {
 	// If prev is exactly 2 chars, both lowercase, and curr starts lowercase,
 	// check if prev looks like a common 2-letter word.
 	if len(prev) == 2 && lastChar >= 'a' && lastChar <= 'z' && prev[0] >= 'a' && prev[0] <= 'z' {
-		// Common 2-letter words that should NOT be joined to next fragment
-		commonWords := map[string]bool{
-			"an": true, "as": true, "at": true, "be": true, "by": true,
-			"do": true, "go": true, "he": true, "if": true, "in": true,
-			"is": true, "it": true, "me": true, "my": true, "no": true,
-			"of": true, "on": true, "or": true, "so": true, "to": true,
-			"up": true, "us": true, "we": true,
-		}
-		if commonWords[prev] {
+		if commonTwoLetterWords[prev] {
 			// It's a real word — add space if next also looks like a word start
 			if firstChar >= 'a' && firstChar <= 'z' && len(curr) >= 2 {
 				return true
@@ -1054,10 +1164,7 @@ func (t *BabelDocTranslator) generateGoPDF2OverlayPDF(originalPath string, block
 		})
 	}
 
-	gen := NewGoPDF2Generator(t.workDir)
-	if t.fontPath != "" {
-		gen.fontPath = t.fontPath
-	}
+	gen := t.newGoPDF2Generator()
 	return gen.GenerateTranslatedPDF(originalPath, translatedBlocks, outputPath)
 }
 
@@ -1104,8 +1211,8 @@ func FilterTranslatableBlocks(blocks []BabelDocBlock) []BabelDocBlock {
 		}
 
 		// Skip blocks that look like page identifiers (e.g., "Preprint", "arXiv:...")
-		textLower := strings.ToLower(strings.TrimSpace(block.Text))
-		if textLower == "preprint" || strings.HasPrefix(textLower, "arxiv:") {
+		text := strings.TrimSpace(block.Text)
+		if strings.EqualFold(text, "preprint") || hasPrefixFold(text, "arxiv:") {
 			continue
 		}
 		
@@ -1159,11 +1266,22 @@ func (t *BabelDocTranslator) CheckPageCountDifference(originalPath, translatedPa
 		return nil, fmt.Errorf("failed to get original PDF page count: %w", err)
 	}
 
+	return t.CheckTranslatedPageCount(originalPages, translatedPath)
+}
+
+// CheckTranslatedPageCount 与 CheckPageCountDifference 相同，但原始页数已知（例如加载 PDF 时已获取），
+// 只需打开翻译后的 PDF
+func (t *BabelDocTranslator) CheckTranslatedPageCount(originalPages int, translatedPath string) (*PageCountResult, error) {
 	translatedPages, err := t.GetPDFPageCount(translatedPath)
 	if err != nil {
 		return nil, fmt.Errorf("failed to get translated PDF page count: %w", err)
 	}
 
+	return comparePageCounts(originalPages, translatedPages), nil
+}
+
+// comparePageCounts 根据原始页数和翻译后页数生成页数差异结果
+func comparePageCounts(originalPages, translatedPages int) *PageCountResult {
 	result := &PageCountResult{
 		OriginalPages:   originalPages,
 		TranslatedPages: translatedPages,
@@ -1185,7 +1303,7 @@ func (t *BabelDocTranslator) CheckPageCountDifference(originalPath, translatedPa
 			logger.Float64("diffPercent", result.DiffPercent*100))
 	}
 
-	return result, nil
+	return result
 }
 
 // FormatPageCountError 格式化页数差异错误信息
@@ -1216,6 +1334,14 @@ func (t *BabelDocTranslator) TranslatePDFWithPyMuPDFProgressive(inputPath, outpu
 // TranslatePDFWithGoPDF2Progressive translates a PDF with progressive page updates.
 // Pure Go implementation: extract text → translate via API → overlay with GoPDF2.
 func (t *BabelDocTranslator) TranslatePDFWithGoPDF2Progressive(inputPath, outputPath, apiKey, baseURL, model string, progressCallback func(message string), pageCallback PageCompleteCallback) error {
+	return t.TranslateBlocksWithGoPDF2Progressive(inputPath, outputPath, nil, 0, apiKey, baseURL, model, progressCallback, pageCallback)
+}
+
+// TranslateBlocksWithGoPDF2Progressive is TranslatePDFWithGoPDF2Progressive for blocks that
+// were already extracted from inputPath (e.g. when the PDF was loaded), so the PDF is not parsed twice.
+// If blocks is nil, they are extracted from inputPath. pageCount is the page count of inputPath,
+// if it is not known (<= 0) it is taken from the extraction or read from the file.
+func (t *BabelDocTranslator) TranslateBlocksWithGoPDF2Progressive(inputPath, outputPath string, blocks []BabelDocBlock, pageCount int, apiKey, baseURL, model string, progressCallback func(message string), pageCallback PageCompleteCallback) error {
 	logger.Info("starting Go PDF translation",
 		logger.String("input", inputPath),
 		logger.String("output", outputPath))
@@ -1238,14 +1364,18 @@ func (t *BabelDocTranslator) TranslatePDFWithGoPDF2Progressive(inputPath, output
 		os.MkdirAll(outputDir, 0755)
 	}
 
-	// Phase 1: Extract text blocks using Go
-	if progressCallback != nil {
-		progressCallback("正在提取文本...")
-	}
+	// Phase 1: Extract text blocks using Go (skipped when blocks were passed in)
+	if blocks == nil {
+		if progressCallback != nil {
+			progressCallback("正在提取文本...")
+		}
 
-	blocks, err := t.ExtractBlocks(inputPath)
-	if err != nil {
-		return fmt.Errorf("text extraction failed: %w", err)
+		extracted, extractedPages, err := t.extractBlocks(inputPath)
+		if err != nil {
+			return fmt.Errorf("text extraction failed: %w", err)
+		}
+		blocks = extracted
+		pageCount = extractedPages
 	}
 
 	// Filter translatable blocks
@@ -1264,8 +1394,11 @@ func (t *BabelDocTranslator) TranslatePDFWithGoPDF2Progressive(inputPath, output
 		return t.copyFile(inputPath, outputPath)
 	}
 
-	// Get total pages for progress reporting
-	totalPages, _ := t.GetPDFPageCount(inputPath)
+	// Get total pages for progress reporting (only reopens the PDF if the count is unknown)
+	totalPages := pageCount
+	if totalPages <= 0 {
+		totalPages, _ = t.GetPDFPageCount(inputPath)
+	}
 	if totalPages <= 0 {
 		totalPages = 1
 	}
@@ -1394,10 +1527,7 @@ func (t *BabelDocTranslator) TranslatePDFWithGoPDF2Progressive(inputPath, output
 		})
 	}
 
-	gen := NewGoPDF2Generator(t.workDir)
-	if t.fontPath != "" {
-		gen.fontPath = t.fontPath
-	}
+	gen := t.newGoPDF2Generator()
 
 	if err := gen.GenerateTranslatedPDF(inputPath, translatedBlocks, outputPath); err != nil {
 		return fmt.Errorf("PDF generation failed: %w", err)
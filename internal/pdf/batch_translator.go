@@ -19,6 +19,11 @@ const BatchSeparator = "\n---BLOCK_SEPARATOR---\n"
 // DefaultContextWindow is the default context window size in characters
 const DefaultContextWindow = 4000
 
+// MaxBlocksPerBatch is the maximum number of text blocks merged into one batch.
+// Smaller batches keep the separator protocol reliable and limit the cost of
+// falling back to single-block translation when a response is malformed.
+const MaxBlocksPerBatch = 20
+
 // DefaultConcurrency is the default number of concurrent batch translations
 const DefaultConcurrency = 3
 
@@ -31,6 +36,21 @@ const DefaultMaxRetries = 3
 // BaseRetryDelay is the base delay between retries (exponential backoff)
 const BaseRetryDelay = 2 * time.Second
 
+// apiTransport is shared by all BatchTranslator clients so connections (and their
+// TLS sessions) to the API host are reused across batches and translators.
+// The default transport keeps only 2 idle connections per host, fewer than the
+// number of concurrent batches, so connections would otherwise be closed and
+// re-established between requests.
+var apiTransport = newAPITransport()
+
+func newAPITransport() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConns = 64
+	t.MaxIdleConnsPerHost = 32
+	t.IdleConnTimeout = 90 * time.Second
+	return t
+}
+
 // BatchTranslator 负责批量翻译文本
 type BatchTranslator struct {
 	apiKey        string
@@ -76,7 +96,8 @@ func NewBatchTranslator(cfg BatchTranslatorConfig) *BatchTranslator {
 		contextWindow: contextWindow,
 		concurrency:   concurrency,
 		client: &http.Client{
-			Timeout: timeout,
+			Timeout:   timeout,
+			Transport: apiTransport,
 		},
 	}
 }
@@ -84,6 +105,7 @@ func NewBatchTranslator(cfg BatchTranslatorConfig) *BatchTranslator {
 // MergeBatches 将文本块合并为批次
 // 根据上下文窗口大小动态调整批次大小
 // Property 5: 每个批次的总字符数应小于上下文窗口大小，所有批次的文本块总数等于输入总数
+// 每个批次最多包含 MaxBlocksPerBatch 个文本块
 func (b *BatchTranslator) MergeBatches(blocks []TextBlock) [][]TextBlock {
 	if len(blocks) == 0 {
 		return nil
@@ -119,8 +141,8 @@ func (b *BatchTranslator) MergeBatches(blocks []TextBlock) [][]TextBlock {
 			additionalSize += separatorSize
 		}
 
-		// Check if adding this block would exceed the context window
-		if currentBatchSize+additionalSize > b.contextWindow {
+		// Check if adding this block would exceed the context window or the block limit
+		if currentBatchSize+additionalSize > b.contextWindow || len(currentBatch) >= MaxBlocksPerBatch {
 			// Flush current batch and start a new one
 			if len(currentBatch) > 0 {
 				batches = append(batches, currentBatch)
@@ -292,7 +314,10 @@ func (b *BatchTranslator) translateSingleBatch(batch []TextBlock) ([]TranslatedB
 	}
 
 	// Split the translated text back into individual blocks
-	translatedParts := b.splitTranslatedText(translatedText, len(batch))
+	translatedParts, err := b.splitTranslatedText(translatedText, len(batch))
+	if err != nil {
+		return nil, err
+	}
 
 	// Map translated text back to original blocks
 	results := make([]TranslatedBlock, len(batch))
@@ -307,43 +332,32 @@ func (b *BatchTranslator) translateSingleBatch(batch []TextBlock) ([]TranslatedB
 	return results, nil
 }
 
-// splitTranslatedText splits the translated text by BatchSeparator and ensures
-// the number of parts matches the expected count
-func (b *BatchTranslator) splitTranslatedText(translatedText string, expectedCount int) []string {
-	// Split by the batch separator
-	parts := strings.Split(translatedText, BatchSeparator)
-
-	// If we got the expected number of parts, return them
-	if len(parts) == expectedCount {
-		// Trim whitespace from each part
-		for i := range parts {
-			parts[i] = strings.TrimSpace(parts[i])
-		}
-		return parts
+// splitTranslatedText splits the translated text by BatchSeparator.
+// A response whose block count does not match the batch cannot be mapped back
+// reliably, so it is reported as an error and the caller falls back to
+// single-block translation.
+func (b *BatchTranslator) splitTranslatedText(translatedText string, expectedCount int) ([]string, error) {
+	// A single block needs no splitting, even if the separator appears in the output
+	if expectedCount == 1 {
+		return []string{strings.TrimSpace(translatedText)}, nil
 	}
 
-	// If we got fewer parts, pad with empty strings
-	if len(parts) < expectedCount {
-		for i := range parts {
-			parts[i] = strings.TrimSpace(parts[i])
-		}
-		for len(parts) < expectedCount {
-			parts = append(parts, "")
-		}
-		return parts
+	// Split by the batch separator
+	parts := strings.Split(translatedText, BatchSeparator)
+	if len(parts) != expectedCount {
+		return nil, NewPDFErrorWithDetails(
+			ErrTranslateFailed,
+			"batch response block count mismatch",
+			fmt.Sprintf("expected %d blocks, got %d", expectedCount, len(parts)),
+			nil,
+		)
 	}
 
-	// If we got more parts, try to merge extra parts into the last expected slot
-	// This handles cases where the separator might appear in the translated text
-	result := make([]string, expectedCount)
-	for i := 0; i < expectedCount-1; i++ {
-		result[i] = strings.TrimSpace(parts[i])
+	// Trim whitespace from each part
+	for i := range parts {
+		parts[i] = strings.TrimSpace(parts[i])
 	}
-	// Merge remaining parts into the last slot
-	remaining := parts[expectedCount-1:]
-	result[expectedCount-1] = strings.TrimSpace(strings.Join(remaining, BatchSeparator))
-
-	return result
+	return parts, nil
 }
 
 // callOpenAIAPI calls the OpenAI API to translate the batch text
@@ -521,7 +535,9 @@ func (b *BatchTranslator) TranslateWithRetry(blocks []TextBlock, maxRetries int)
 }
 
 // TranslateWithRetryAndProgress 带重试和进度回调的翻译
-// progressCallback: 可选的进度回调函数，每完成一个批次后调用
+// 各批次按 b.concurrency 并发翻译，返回结果保持输入顺序
+// progressCallback: 可选的进度回调函数，每完成一个批次后调用（调用已串行化，但可能来自不同 goroutine）
+// 某个批次最终失败时，仍返回与输入对齐的全部结果（失败块的 TranslatedText 为空）以及第一个错误
 func (b *BatchTranslator) TranslateWithRetryAndProgress(blocks []TextBlock, maxRetries int, progressCallback ProgressCallback) ([]TranslatedBlock, error) {
 	if len(blocks) == 0 {
 		return nil, nil
@@ -531,89 +547,100 @@ func (b *BatchTranslator) TranslateWithRetryAndProgress(blocks []TextBlock, maxR
 		maxRetries = DefaultMaxRetries
 	}
 
+	// Identical texts (running headers, repeated captions) are translated only once
+	uniqueBlocks := dedupeBlocksByText(blocks)
+
 	// First, merge blocks into batches based on context window
-	batches := b.MergeBatches(blocks)
+	batches := b.MergeBatches(uniqueBlocks)
 	if len(batches) == 0 {
 		return nil, nil
 	}
 
 	logger.Info("starting batch translation",
 		logger.Int("totalBlocks", len(blocks)),
+		logger.Int("uniqueBlocks", len(uniqueBlocks)),
 		logger.Int("batchCount", len(batches)),
-		logger.Int("contextWindow", b.contextWindow))
+		logger.Int("contextWindow", b.contextWindow),
+		logger.Int("concurrency", b.concurrency))
 
-	// Process each batch with retries
-	results := make([]TranslatedBlock, 0, len(blocks))
-	completedBlocks := 0
+	// Batches are translated concurrently (bounded by b.concurrency), results keep the batch order
+	batchResults := make([][]TranslatedBlock, len(batches))
+	completedBlocks := 0 // unique blocks finished
 	totalBlocks := len(blocks)
-	
-	for batchIdx, batch := range batches {
-		logger.Debug("translating batch",
-			logger.Int("batchIndex", batchIdx+1),
-			logger.Int("totalBatches", len(batches)),
-			logger.Int("blocksInBatch", len(batch)))
 
-		// Try batch translation with retries
-		var lastErr error
-		var translatedBatch []TranslatedBlock
-		
-		for attempt := 1; attempt <= maxRetries; attempt++ {
-			logger.Debug("batch translation attempt",
-				logger.Int("batchIndex", batchIdx+1),
-				logger.Int("attempt", attempt),
-				logger.Int("maxRetries", maxRetries))
-
-			var err error
-			translatedBatch, err = b.translateSingleBatch(batch)
-			if err == nil {
-				logger.Debug("batch translation succeeded",
-					logger.Int("batchIndex", batchIdx+1),
-					logger.Int("attempt", attempt))
-				break
-			}
+	// A batch failing for good does not stop the others, its error is returned with the results
+	var firstErr error
+	var mu sync.Mutex // protects completedBlocks, firstErr and progress callbacks
 
-			lastErr = err
-			logger.Warn("batch translation attempt failed",
-				logger.Int("batchIndex", batchIdx+1),
-				logger.Int("attempt", attempt),
-				logger.Err(err))
+	// advance reports n more finished unique blocks, scaled to the total block count
+	advance := func(n int) {
+		mu.Lock()
+		defer mu.Unlock()
+		completedBlocks += n
+		if progressCallback != nil {
+			progressCallback(completedBlocks*totalBlocks/len(uniqueBlocks), totalBlocks)
+		}
+	}
 
-			// Check if the error is retryable
-			if !b.isRetryableError(err) {
-				logger.Error("non-retryable error, failing batch", err)
-				break
+	sem := make(chan struct{}, b.concurrency)
+	var wg sync.WaitGroup
+
+	for batchIdx, batch := range batches {
+		wg.Add(1)
+		go func(batchIdx int, batch []TextBlock) {
+			defer wg.Done()
+
+			// Acquire semaphore
+			sem <- struct{}{}
+			defer func() { <-sem }()
+
+			translatedBatch, err := b.translateBatchWithRetry(batchIdx, len(batches), batch, maxRetries, advance)
+			if err != nil {
+				mu.Lock()
+				if firstErr == nil {
+					firstErr = err
+				}
+				mu.Unlock()
+				return
 			}
+			batchResults[batchIdx] = translatedBatch
+		}(batchIdx, batch)
+	}
+
+	wg.Wait()
 
-			// Don't sleep after the last attempt
-			if attempt < maxRetries {
-				delay := b.calculateBackoffDelay(attempt)
-				logger.Debug("retrying after delay",
-					logger.String("delay", delay.String()),
-					logger.Int("nextAttempt", attempt+1))
-				time.Sleep(delay)
+	// Blocks of failed batches keep an empty translation, so the results stay aligned with the input
+	results := make([]TranslatedBlock, 0, len(uniqueBlocks))
+	for batchIdx, translatedBatch := range batchResults {
+		if translatedBatch == nil {
+			for _, block := range batches[batchIdx] {
+				results = append(results, TranslatedBlock{TextBlock: block})
 			}
+			continue
 		}
+		results = append(results, translatedBatch...)
+	}
 
-		// If batch translation failed, try single-block translation as fallback
-		if translatedBatch == nil && lastErr != nil {
-			logger.Warn("batch translation failed, falling back to single-block translation",
-				logger.Int("batchIndex", batchIdx+1),
-				logger.Int("blocksInBatch", len(batch)))
-			
-			var err error
-			translatedBatch, err = b.translateBlocksIndividuallyWithProgress(batch, maxRetries, lastErr, completedBlocks, totalBlocks, progressCallback)
-			if err != nil {
-				return nil, err
+	// Apply each translation to every block with the same text
+	if len(uniqueBlocks) < len(blocks) {
+		translations := make(map[string]string, len(results))
+		for _, tb := range results {
+			translations[tb.Text] = tb.TranslatedText
+		}
+		results = make([]TranslatedBlock, len(blocks))
+		for i, block := range blocks {
+			results[i] = TranslatedBlock{
+				TextBlock:      block,
+				TranslatedText: translations[block.Text],
 			}
 		}
+	}
 
-		results = append(results, translatedBatch...)
-		
-		// Update progress after each batch
-		completedBlocks += len(batch)
-		if progressCallback != nil {
-			progressCallback(completedBlocks, totalBlocks)
-		}
+	if firstErr != nil {
+		logger.Warn("batch translation completed with errors, returning partial results",
+			logger.Int("totalBlocks", len(blocks)),
+			logger.Err(firstErr))
+		return results, firstErr
 	}
 
 	logger.Info("batch translation completed",
@@ -623,6 +650,96 @@ func (b *BatchTranslator) TranslateWithRetryAndProgress(blocks []TextBlock, maxR
 	return results, nil
 }
 
+// dedupeBlocksByText returns the blocks with the first occurrence of each text, in order
+func dedupeBlocksByText(blocks []TextBlock) []TextBlock {
+	seen := make(map[string]bool, len(blocks))
+	unique := make([]TextBlock, 0, len(blocks))
+	for _, block := range blocks {
+		if seen[block.Text] {
+			continue
+		}
+		seen[block.Text] = true
+		unique = append(unique, block)
+	}
+	return unique
+}
+
+// translateBatchWithRetry translates one batch with retries and exponential backoff,
+// falling back to single-block translation if the batch keeps failing.
+// advance is called with the number of blocks finished, adding up to len(batch).
+func (b *BatchTranslator) translateBatchWithRetry(batchIdx, totalBatches int, batch []TextBlock, maxRetries int, advance func(n int)) ([]TranslatedBlock, error) {
+	logger.Debug("translating batch",
+		logger.Int("batchIndex", batchIdx+1),
+		logger.Int("totalBatches", totalBatches),
+		logger.Int("blocksInBatch", len(batch)))
+
+	// Try batch translation with retries
+	var lastErr error
+	var translatedBatch []TranslatedBlock
+
+	for attempt := 1; attempt <= maxRetries; attempt++ {
+		logger.Debug("batch translation attempt",
+			logger.Int("batchIndex", batchIdx+1),
+			logger.Int("attempt", attempt),
+			logger.Int("maxRetries", maxRetries))
+
+		var err error
+		translatedBatch, err = b.translateSingleBatch(batch)
+		if err == nil {
+			logger.Debug("batch translation succeeded",
+				logger.Int("batchIndex", batchIdx+1),
+				logger.Int("attempt", attempt))
+			break
+		}
+
+		lastErr = err
+		logger.Warn("batch translation attempt failed",
+			logger.Int("batchIndex", batchIdx+1),
+			logger.Int("attempt", attempt),
+			logger.Err(err))
+
+		// Check if the error is retryable
+		if !b.isRetryableError(err) {
+			logger.Error("non-retryable error, failing batch", err)
+			break
+		}
+
+		// Don't sleep after the last attempt
+		if attempt < maxRetries {
+			delay := b.calculateBackoffDelay(attempt)
+			logger.Debug("retrying after delay",
+				logger.String("delay", delay.String()),
+				logger.Int("nextAttempt", attempt+1))
+			time.Sleep(delay)
+		}
+	}
+
+	// If batch translation failed, try single-block translation as fallback
+	reported := 0
+	if translatedBatch == nil && lastErr != nil {
+		logger.Warn("batch translation failed, falling back to single-block translation",
+			logger.Int("batchIndex", batchIdx+1),
+			logger.Int("blocksInBatch", len(batch)))
+
+		var err error
+		translatedBatch, err = b.translateBlocksIndividuallyWithProgress(batch, maxRetries, lastErr, 0, len(batch), func(completed, total int) {
+			advance(completed - reported)
+			reported = completed
+		})
+		if err != nil {
+			advance(len(batch) - reported)
+			return nil, err
+		}
+	}
+
+	// Update progress for the rest of the batch
+	if reported < len(batch) {
+		advance(len(batch) - reported)
+	}
+
+	return translatedBatch, nil
+}
+
 // translateBlocksIndividually translates each block individually as a fallback
 // when batch translation fails. This is the degradation strategy mentioned in
 // the design document: "批次翻译失败 -> 降级为单块翻译"
@@ -0,0 +1,342 @@
+package pdf
+
+import (
+	"encoding/json"
+	"fmt"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"sync"
+	"testing"
+	"time"
+)
+
+// newFakeTranslationServer returns a chat completions server that "translates" every
+// block of a batch by prefixing it with "zh:", keeping the batch separators.
+// It records the highest number of requests it served at the same time.
+func newFakeTranslationServer(t *testing.T, maxInFlight *int) *httptest.Server {
+	var mu sync.Mutex
+	inFlight := 0
+
+	return httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		mu.Lock()
+		inFlight++
+		if inFlight > *maxInFlight {
+			*maxInFlight = inFlight
+		}
+		mu.Unlock()
+		defer func() {
+			mu.Lock()
+			inFlight--
+			mu.Unlock()
+		}()
+
+		var req ChatCompletionRequest
+		if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+			t.Errorf("failed to decode request: %v", err)
+			w.WriteHeader(http.StatusBadRequest)
+			return
+		}
+
+		// The batch text follows the instructions after the first blank line
+		userPrompt := req.Messages[len(req.Messages)-1].Content
+		batchText := userPrompt[strings.Index(userPrompt, "\n\n")+2:]
+
+		parts := strings.Split(batchText, BatchSeparator)
+		for i := range parts {
+			parts[i] = "zh:" + parts[i]
+		}
+
+		time.Sleep(20 * time.Millisecond)
+
+		json.NewEncoder(w).Encode(ChatCompletionResponse{
+			Choices: []Choice{{Message: Message{Role: "assistant", Content: strings.Join(parts, BatchSeparator)}}},
+		})
+	}))
+}
+
+// TestTranslateWithRetryAndProgressConcurrent tests that batches are translated concurrently
+// and that results and progress stay consistent
+func TestTranslateWithRetryAndProgressConcurrent(t *testing.T) {
+	maxInFlight := 0
+	server := newFakeTranslationServer(t, &maxInFlight)
+	defer server.Close()
+
+	translator := NewBatchTranslator(BatchTranslatorConfig{
+		APIKey:        "test-key",
+		BaseURL:       server.URL,
+		ContextWindow: 50, // a few blocks per batch
+		Concurrency:   4,
+	})
+
+	var blocks []TextBlock
+	for i := 0; i < 40; i++ {
+		blocks = append(blocks, TextBlock{ID: fmt.Sprintf("block_%d", i), Text: fmt.Sprintf("text %d", i)})
+	}
+
+	lastCompleted := 0
+	results, err := translator.TranslateWithRetryAndProgress(blocks, 1, func(completed, total int) {
+		if completed < lastCompleted {
+			t.Errorf("progress went backwards: %d after %d", completed, lastCompleted)
+		}
+		if total != len(blocks) {
+			t.Errorf("progress total = %d, want %d", total, len(blocks))
+		}
+		lastCompleted = completed
+	})
+	if err != nil {
+		t.Fatalf("TranslateWithRetryAndProgress failed: %v", err)
+	}
+
+	if len(results) != len(blocks) {
+		t.Fatalf("got %d results, want %d", len(results), len(blocks))
+	}
+	for i, result := range results {
+		if result.ID != blocks[i].ID {
+			t.Errorf("result %d has ID %s, want %s", i, result.ID, blocks[i].ID)
+		}
+		if want := "zh:" + blocks[i].Text; result.TranslatedText != want {
+			t.Errorf("result %d translated to %q, want %q", i, result.TranslatedText, want)
+		}
+	}
+	if lastCompleted != len(blocks) {
+		t.Errorf("final progress = %d, want %d", lastCompleted, len(blocks))
+	}
+	if maxInFlight < 2 {
+		t.Errorf("batches were not translated concurrently (max in flight %d)", maxInFlight)
+	}
+	if maxInFlight > 4 {
+		t.Errorf("concurrency limit exceeded: %d requests in flight", maxInFlight)
+	}
+}
+
+// TestMergeBatchesBlockLimit tests that no batch holds more than MaxBlocksPerBatch blocks
+func TestMergeBatchesBlockLimit(t *testing.T) {
+	translator := NewBatchTranslator(BatchTranslatorConfig{ContextWindow: 100000})
+
+	var blocks []TextBlock
+	for i := 0; i < 2*MaxBlocksPerBatch+1; i++ {
+		blocks = append(blocks, TextBlock{ID: fmt.Sprintf("block_%d", i), Text: "short"})
+	}
+
+	batches := translator.MergeBatches(blocks)
+	if len(batches) != 3 {
+		t.Fatalf("got %d batches, want 3", len(batches))
+	}
+	for i, batch := range batches {
+		if len(batch) > MaxBlocksPerBatch {
+			t.Errorf("batch %d has %d blocks, want at most %d", i, len(batch), MaxBlocksPerBatch)
+		}
+	}
+}
+
+// TestTranslateWithRetryFallsBackOnBlockCountMismatch tests that a batch response with
+// the wrong number of blocks is retranslated block by block instead of being misaligned
+func TestTranslateWithRetryFallsBackOnBlockCountMismatch(t *testing.T) {
+	var mu sync.Mutex
+	requests := 0
+
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		mu.Lock()
+		requests++
+		mu.Unlock()
+
+		var req ChatCompletionRequest
+		json.NewDecoder(r.Body).Decode(&req)
+		userPrompt := req.Messages[len(req.Messages)-1].Content
+		batchText := userPrompt[strings.Index(userPrompt, "\n\n")+2:]
+
+		// Drop the separators, as a model sometimes does
+		content := "zh:" + strings.ReplaceAll(batchText, BatchSeparator, " ")
+		json.NewEncoder(w).Encode(ChatCompletionResponse{
+			Choices: []Choice{{Message: Message{Role: "assistant", Content: content}}},
+		})
+	}))
+	defer server.Close()
+
+	translator := NewBatchTranslator(BatchTranslatorConfig{APIKey: "test-key", BaseURL: server.URL})
+
+	blocks := []TextBlock{
+		{ID: "b1", Text: "first"},
+		{ID: "b2", Text: "second"},
+		{ID: "b3", Text: "third"},
+	}
+	results, err := translator.TranslateWithRetry(blocks, 3)
+	if err != nil {
+		t.Fatalf("TranslateWithRetry failed: %v", err)
+	}
+
+	for i, result := range results {
+		if want := "zh:" + blocks[i].Text; result.TranslatedText != want {
+			t.Errorf("result %d translated to %q, want %q", i, result.TranslatedText, want)
+		}
+	}
+	// One batch request without retries, then one request per block
+	if requests != 1+len(blocks) {
+		t.Errorf("server got %d requests, want %d", requests, 1+len(blocks))
+	}
+}
+
+// TestTranslateWithRetryDeduplicatesTexts tests that repeated texts are sent once
+// and that every block still gets its translation
+func TestTranslateWithRetryDeduplicatesTexts(t *testing.T) {
+	var mu sync.Mutex
+	var sentTexts []string
+
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		var req ChatCompletionRequest
+		json.NewDecoder(r.Body).Decode(&req)
+		userPrompt := req.Messages[len(req.Messages)-1].Content
+		batchText := userPrompt[strings.Index(userPrompt, "\n\n")+2:]
+
+		parts := strings.Split(batchText, BatchSeparator)
+		mu.Lock()
+		sentTexts = append(sentTexts, parts...)
+		mu.Unlock()
+		for i := range parts {
+			parts[i] = "zh:" + parts[i]
+		}
+		json.NewEncoder(w).Encode(ChatCompletionResponse{
+			Choices: []Choice{{Message: Message{Role: "assistant", Content: strings.Join(parts, BatchSeparator)}}},
+		})
+	}))
+	defer server.Close()
+
+	translator := NewBatchTranslator(BatchTranslatorConfig{APIKey: "test-key", BaseURL: server.URL})
+
+	blocks := []TextBlock{
+		{ID: "b1", Page: 1, Text: "Running header"},
+		{ID: "b2", Page: 1, Text: "Body text"},
+		{ID: "b3", Page: 2, Text: "Running header"},
+		{ID: "b4", Page: 3, Text: "Running header"},
+	}
+	lastCompleted := 0
+	results, err := translator.TranslateWithRetryAndProgress(blocks, 1, func(completed, total int) {
+		lastCompleted = completed
+	})
+	if err != nil {
+		t.Fatalf("TranslateWithRetryAndProgress failed: %v", err)
+	}
+
+	if len(sentTexts) != 2 {
+		t.Errorf("sent %d texts to the API, want 2: %q", len(sentTexts), sentTexts)
+	}
+	if len(results) != len(blocks) {
+		t.Fatalf("got %d results, want %d", len(results), len(blocks))
+	}
+	for i, result := range results {
+		if result.ID != blocks[i].ID || result.Page != blocks[i].Page {
+			t.Errorf("result %d is block %s on page %d, want %s on page %d", i, result.ID, result.Page, blocks[i].ID, blocks[i].Page)
+		}
+		if want := "zh:" + blocks[i].Text; result.TranslatedText != want {
+			t.Errorf("result %d translated to %q, want %q", i, result.TranslatedText, want)
+		}
+	}
+	if lastCompleted != len(blocks) {
+		t.Errorf("final progress = %d, want %d", lastCompleted, len(blocks))
+	}
+}
+
+// newFailingTranslationServer returns a chat completions server like newFakeTranslationServer
+// that rejects every request containing a "bad" block with a non-retryable error
+func newFailingTranslationServer() *httptest.Server {
+	return httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		var req ChatCompletionRequest
+		json.NewDecoder(r.Body).Decode(&req)
+		userPrompt := req.Messages[len(req.Messages)-1].Content
+		batchText := userPrompt[strings.Index(userPrompt, "\n\n")+2:]
+
+		// Reject every request with a "bad" block (non-retryable)
+		if strings.Contains(batchText, "bad") {
+			w.WriteHeader(http.StatusBadRequest)
+			return
+		}
+
+		parts := strings.Split(batchText, BatchSeparator)
+		for i := range parts {
+			parts[i] = "zh:" + parts[i]
+		}
+		json.NewEncoder(w).Encode(ChatCompletionResponse{
+			Choices: []Choice{{Message: Message{Role: "assistant", Content: strings.Join(parts, BatchSeparator)}}},
+		})
+	}))
+}
+
+// TestTranslateWithRetryKeepsPartialResults tests that a batch failing for good
+// does not discard the translations of the other batches
+func TestTranslateWithRetryKeepsPartialResults(t *testing.T) {
+	server := newFailingTranslationServer()
+	defer server.Close()
+
+	translator := NewBatchTranslator(BatchTranslatorConfig{
+		APIKey:        "test-key",
+		BaseURL:       server.URL,
+		ContextWindow: 2*len("good 1") + len(BatchSeparator), // two blocks per batch
+		Concurrency:   4,
+	})
+
+	blocks := []TextBlock{
+		{ID: "b1", Text: "good 1"},
+		{ID: "b2", Text: "good 2"},
+		{ID: "b3", Text: "bad  1"},
+		{ID: "b4", Text: "bad  2"},
+		{ID: "b5", Text: "good 3"},
+	}
+	results, err := translator.TranslateWithRetry(blocks, 1)
+	if err == nil {
+		t.Error("TranslateWithRetry should report the failed batch")
+	}
+	checkPartialResults(t, blocks, results)
+}
+
+// TestTranslateWithRetryContinuesAfterFailedBatch tests that the batches queued
+// behind a failed batch are still translated
+func TestTranslateWithRetryContinuesAfterFailedBatch(t *testing.T) {
+	server := newFailingTranslationServer()
+	defer server.Close()
+
+	translator := NewBatchTranslator(BatchTranslatorConfig{
+		APIKey:        "test-key",
+		BaseURL:       server.URL,
+		ContextWindow: 2*len("good 1") + len(BatchSeparator),
+		Concurrency:   1, // batches run one after another, some of them after the failed one
+	})
+
+	blocks := []TextBlock{
+		{ID: "b1", Text: "bad  1"},
+		{ID: "b2", Text: "bad  2"},
+		{ID: "b3", Text: "good 1"},
+		{ID: "b4", Text: "good 2"},
+		{ID: "b5", Text: "good 3"},
+	}
+	lastCompleted := 0
+	results, err := translator.TranslateWithRetryAndProgress(blocks, 1, func(completed, total int) {
+		lastCompleted = completed
+	})
+	if err == nil {
+		t.Error("TranslateWithRetryAndProgress should report the failed batch")
+	}
+	checkPartialResults(t, blocks, results)
+	if lastCompleted != len(blocks) {
+		t.Errorf("final progress = %d, want %d", lastCompleted, len(blocks))
+	}
+}
+
+// checkPartialResults checks that results are aligned with blocks, with the "good"
+// blocks translated and the "bad" ones left empty
+func checkPartialResults(t *testing.T, blocks []TextBlock, results []TranslatedBlock) {
+	t.Helper()
+
+	if len(results) != len(blocks) {
+		t.Fatalf("got %d results, want %d", len(results), len(blocks))
+	}
+	for i, result := range results {
+		want := "zh:" + blocks[i].Text
+		if strings.Contains(blocks[i].Text, "bad") {
+			want = ""
+		}
+		if result.ID != blocks[i].ID || result.TranslatedText != want {
+			t.Errorf("result %d = %s %q, want %s %q", i, result.ID, result.TranslatedText, blocks[i].ID, want)
+		}
+	}
+}
@@ -1,18 +1,29 @@
 package pdf
 
 import (
-	"crypto/sha256"
-	"encoding/hex"
+	"bufio"
 	"encoding/json"
+	"fmt"
+	"hash/fnv"
+	"io"
 	"os"
+	"strings"
 	"sync"
 	"time"
+	"unicode"
+
+	"latex-translator/internal/logger"
 )
 
+// journalFlushInterval 每积累这么多条新翻译就追加写入一次日志文件
+const journalFlushInterval = 50
+
 // TranslationCache 负责缓存翻译结果
 type TranslationCache struct {
 	cachePath string
-	cache     map[string]CacheEntry // hash -> CacheEntry
+	cache     map[string]CacheEntry // cacheKey(original text) -> CacheEntry
+	dirty     bool                  // 内存中有未保存的修改
+	pending   []CacheEntry          // 尚未追加到日志文件的新条目
 	mu        sync.RWMutex
 }
 
@@ -24,19 +35,43 @@ func NewTranslationCache(cachePath string) *TranslationCache {
 	}
 }
 
-// ComputeHash 计算文本哈希（使用 SHA256）
+// ComputeHash 计算文本哈希（使用 FNV-1a 64 位）
+// 哈希只是缓存文件中的条目标识，不涉及安全性，因此不需要加密哈希
 func (c *TranslationCache) ComputeHash(text string) string {
-	hash := sha256.Sum256([]byte(text))
-	return hex.EncodeToString(hash[:])
+	h := fnv.New64a()
+	h.Write([]byte(text))
+	return fmt.Sprintf("%016x", h.Sum64())
+}
+
+// cacheKey 规范化原文作为缓存 key：去掉首尾空白，内部连续空白合并为一个空格，
+// 这样同一段文字因换行或空格不同被提取成不同字符串时仍能命中缓存。
+// 已经规范的文本（最常见的情况）直接返回，不分配内存
+func cacheKey(text string) string {
+	prevSpace := true // 开头的空白也需要去掉
+	for _, r := range text {
+		if unicode.IsSpace(r) {
+			if prevSpace || r != ' ' {
+				return strings.Join(strings.Fields(text), " ")
+			}
+			prevSpace = true
+		} else {
+			prevSpace = false
+		}
+	}
+	if prevSpace && text != "" {
+		// 结尾的空白
+		return strings.Join(strings.Fields(text), " ")
+	}
+	return text
 }
 
 // Get 获取缓存的翻译
+// 内存中直接以规范化的原文为 key，查找时无需计算哈希
 func (c *TranslationCache) Get(text string) (string, bool) {
 	c.mu.RLock()
 	defer c.mu.RUnlock()
 
-	hash := c.ComputeHash(text)
-	entry, ok := c.cache[hash]
+	entry, ok := c.cache[cacheKey(text)]
 	if !ok {
 		return "", false
 	}
@@ -48,17 +83,115 @@ func (c *TranslationCache) Set(text, translation string) {
 	c.mu.Lock()
 	defer c.mu.Unlock()
 
-	hash := c.ComputeHash(text)
-	c.cache[hash] = CacheEntry{
-		Hash:        hash,
+	key := cacheKey(text)
+	if entry, ok := c.cache[key]; ok && entry.Translation == translation {
+		return
+	}
+
+	// 哈希只用于缓存文件格式，仅在写入时计算一次
+	entry := CacheEntry{
+		Hash:        c.ComputeHash(key),
 		Original:    text,
 		Translation: translation,
 		CreatedAt:   time.Now(),
 	}
+	c.dirty = true
+	c.cache[key] = entry
+
+	// 新条目先攒在内存中，每 journalFlushInterval 条追加到日志文件，
+	// 这样中途崩溃也不会丢失整个会话的翻译，而且无需每次重写整个缓存文件
+	if c.cachePath == "" {
+		return
+	}
+	c.pending = append(c.pending, entry)
+	if len(c.pending) >= journalFlushInterval {
+		if err := c.flushJournal(); err != nil {
+			logger.Warn("failed to append to cache journal", logger.Err(err))
+		}
+	}
+}
+
+// journalPath 返回追加日志文件路径
+func (c *TranslationCache) journalPath() string {
+	return c.cachePath + ".journal"
+}
+
+// flushJournal 将待写入的条目以 JSON Lines 格式追加到日志文件并 fsync
+// 调用方需持有写锁
+func (c *TranslationCache) flushJournal() error {
+	if c.cachePath == "" || len(c.pending) == 0 {
+		return nil
+	}
+
+	f, err := os.OpenFile(c.journalPath(), os.O_CREATE|os.O_APPEND|os.O_WRONLY, 0644)
+	if err != nil {
+		return NewPDFError(ErrCacheFailed, "failed to open cache journal", err)
+	}
+
+	w := bufio.NewWriter(f)
+	enc := json.NewEncoder(w)
+	for _, entry := range c.pending {
+		if err := enc.Encode(entry); err != nil {
+			f.Close()
+			return NewPDFError(ErrCacheFailed, "failed to encode cache journal entry", err)
+		}
+	}
+	if err := w.Flush(); err != nil {
+		f.Close()
+		return NewPDFError(ErrCacheFailed, "failed to write cache journal", err)
+	}
+	if err := f.Sync(); err != nil {
+		f.Close()
+		return NewPDFError(ErrCacheFailed, "failed to sync cache journal", err)
+	}
+	if err := f.Close(); err != nil {
+		return NewPDFError(ErrCacheFailed, "failed to close cache journal", err)
+	}
+
+	c.pending = c.pending[:0]
+	return nil
+}
+
+// replayJournal 将日志文件中的条目合并到内存缓存，返回合并的条目数
+// 调用方需持有写锁
+func (c *TranslationCache) replayJournal() (int, error) {
+	f, err := os.Open(c.journalPath())
+	if os.IsNotExist(err) {
+		return 0, nil
+	}
+	if err != nil {
+		return 0, NewPDFError(ErrCacheFailed, "failed to open cache journal", err)
+	}
+
+	dec := json.NewDecoder(f)
+	replayed := 0
+	var validEnd int64 // 最后一个完整条目结束的位置
+	corrupt := false
+	for {
+		var entry CacheEntry
+		if err := dec.Decode(&entry); err != nil {
+			// io.EOF 表示读完；其他错误通常是崩溃时只写了一半的最后一行，之前的条目仍然有效
+			corrupt = err != io.EOF
+			break
+		}
+		c.cache[cacheKey(entry.Original)] = entry
+		replayed++
+		validEnd = dec.InputOffset()
+	}
+	f.Close()
+
+	// 截掉残缺的尾部，否则之后追加的条目会接在它后面，再也无法回放
+	if corrupt {
+		if err := os.Truncate(c.journalPath(), validEnd); err != nil {
+			logger.Warn("failed to truncate cache journal", logger.Err(err))
+		}
+	}
+	return replayed, nil
 }
 
 
 // Load 从文件加载缓存
+// 缓存文件之后追加到日志文件中的条目也会合并进来
 func (c *TranslationCache) Load() error {
 	c.mu.Lock()
 	defer c.mu.Unlock()
@@ -68,40 +201,48 @@ func (c *TranslationCache) Load() error {
 		return nil
 	}
 
-	// Check if file exists
-	if _, err := os.Stat(c.cachePath); os.IsNotExist(err) {
-		// File doesn't exist, start with empty cache
-		return nil
-	}
+	// Check if file exists; if it doesn't, start with the current cache
+	if _, err := os.Stat(c.cachePath); err == nil {
+		// Read the file
+		data, err := os.ReadFile(c.cachePath)
+		if err != nil {
+			return NewPDFError(ErrCacheFailed, "failed to read cache file", err)
+		}
 
-	// Read the file
-	data, err := os.ReadFile(c.cachePath)
-	if err != nil {
-		return NewPDFError(ErrCacheFailed, "failed to read cache file", err)
-	}
+		// Parse the cache file
+		var cacheFile CacheFile
+		if err := json.Unmarshal(data, &cacheFile); err != nil {
+			return NewPDFError(ErrCacheFailed, "failed to parse cache file", err)
+		}
 
-	// Parse the cache file
-	var cacheFile CacheFile
-	if err := json.Unmarshal(data, &cacheFile); err != nil {
-		return NewPDFError(ErrCacheFailed, "failed to parse cache file", err)
+		// Rebuild the cache map from entries
+		c.cache = make(map[string]CacheEntry)
+		for _, entry := range cacheFile.Entries {
+			c.cache[cacheKey(entry.Original)] = entry
+		}
 	}
 
-	// Rebuild the cache map from entries
-	c.cache = make(map[string]CacheEntry)
-	for _, entry := range cacheFile.Entries {
-		c.cache[entry.Hash] = entry
+	// Merge entries journaled after the last Save
+	replayed, err := c.replayJournal()
+	if err != nil {
+		return err
 	}
+	c.pending = nil
+	// 日志中有条目时保持 dirty，下次 Save 会把它们合并进缓存文件
+	c.dirty = replayed > 0
 
 	return nil
 }
 
 // Save 保存缓存到文件
+// 没有修改时直接返回；先写入临时文件再重命名，避免写到一半时留下损坏的缓存文件
+// 保存成功后删除追加日志文件
 func (c *TranslationCache) Save() error {
-	c.mu.RLock()
-	defer c.mu.RUnlock()
+	c.mu.Lock()
+	defer c.mu.Unlock()
 
-	// If cache path is empty, nothing to save
-	if c.cachePath == "" {
+	// If cache path is empty or nothing changed, nothing to save
+	if c.cachePath == "" || !c.dirty {
 		return nil
 	}
 
@@ -117,20 +258,51 @@ func (c *TranslationCache) Save() error {
 		Entries: entries,
 	}
 
-	// Marshal to JSON
-	data, err := json.MarshalIndent(cacheFile, "", "  ")
+	// Marshal to compact JSON (no indentation: faster to write and parse, and much smaller)
+	data, err := json.Marshal(cacheFile)
 	if err != nil {
 		return NewPDFError(ErrCacheFailed, "failed to marshal cache", err)
 	}
 
-	// Write to file
-	if err := os.WriteFile(c.cachePath, data, 0644); err != nil {
+	// Write to a temporary file and fsync it, then replace the cache file atomically.
+	// Without the fsync a crash right after the rename can leave an empty or truncated cache file
+	tmpPath := c.cachePath + ".tmp"
+	if err := writeFileSync(tmpPath, data); err != nil {
+		os.Remove(tmpPath)
 		return NewPDFError(ErrCacheFailed, "failed to write cache file", err)
 	}
+	if err := os.Rename(tmpPath, c.cachePath); err != nil {
+		os.Remove(tmpPath)
+		return NewPDFError(ErrCacheFailed, "failed to replace cache file", err)
+	}
 
+	// 缓存文件已包含所有条目，日志文件不再需要
+	if err := os.Remove(c.journalPath()); err != nil && !os.IsNotExist(err) {
+		logger.Warn("failed to remove cache journal", logger.Err(err))
+	}
+	c.pending = nil
+
+	c.dirty = false
 	return nil
 }
 
+// writeFileSync 写入文件并在关闭前 fsync，保证数据在返回前已落盘
+func writeFileSync(path string, data []byte) error {
+	f, err := os.Create(path)
+	if err != nil {
+		return err
+	}
+	if _, err := f.Write(data); err != nil {
+		f.Close()
+		return err
+	}
+	if err := f.Sync(); err != nil {
+		f.Close()
+		return err
+	}
+	return f.Close()
+}
+
 // FilterCached 过滤出已缓存和未缓存的文本块
 func (c *TranslationCache) FilterCached(blocks []TextBlock) (cached []TranslatedBlock, uncached []TextBlock) {
 	c.mu.RLock()
@@ -140,8 +312,7 @@ func (c *TranslationCache) FilterCached(blocks []TextBlock) (cached []Translated
 	uncached = make([]TextBlock, 0)
 
 	for _, block := range blocks {
-		hash := c.ComputeHash(block.Text)
-		if entry, ok := c.cache[hash]; ok {
+		if entry, ok := c.cache[cacheKey(block.Text)]; ok {
 			// Block is cached
 			cached = append(cached, TranslatedBlock{
 				TextBlock:      block,
@@ -169,6 +340,15 @@ func (c *TranslationCache) Clear() {
 	c.mu.Lock()
 	defer c.mu.Unlock()
 	c.cache = make(map[string]CacheEntry)
+	c.pending = nil
+	c.dirty = true
+
+	// 日志中的条目也要清掉，否则下次 Load 会把它们恢复回来
+	if c.cachePath != "" {
+		if err := os.Remove(c.journalPath()); err != nil && !os.IsNotExist(err) {
+			logger.Warn("failed to remove cache journal", logger.Err(err))
+		}
+	}
 }
 
 // GetCachePath 返回缓存文件路径
@@ -180,5 +360,9 @@ func (c *TranslationCache) GetCachePath() string {
 func (c *TranslationCache) SetCachePath(path string) {
 	c.mu.Lock()
 	defer c.mu.Unlock()
+	if path != c.cachePath {
+		// 新路径下还没有这些条目，下次 Save 需要写入
+		c.dirty = true
+	}
 	c.cachePath = path
 }
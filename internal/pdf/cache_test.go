@@ -0,0 +1,203 @@
+package pdf
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"testing"
+)
+
+// TestTranslationCacheGetSet tests that Set stores a translation that Get and FilterCached return
+func TestTranslationCacheGetSet(t *testing.T) {
+	cache := NewTranslationCache("")
+
+	if _, ok := cache.Get("Hello world"); ok {
+		t.Error("Get should miss on an empty cache")
+	}
+
+	cache.Set("Hello world", "你好世界")
+
+	translation, ok := cache.Get("Hello world")
+	if !ok {
+		t.Fatal("Get should hit after Set")
+	}
+	if translation != "你好世界" {
+		t.Errorf("Get returned %q, want %q", translation, "你好世界")
+	}
+
+	cached, uncached := cache.FilterCached([]TextBlock{
+		{ID: "b1", Text: "Hello world"},
+		{ID: "b2", Text: "Goodbye"},
+	})
+	if len(cached) != 1 || cached[0].ID != "b1" || !cached[0].FromCache {
+		t.Errorf("FilterCached cached = %+v, want only b1", cached)
+	}
+	if len(uncached) != 1 || uncached[0].ID != "b2" {
+		t.Errorf("FilterCached uncached = %+v, want only b2", uncached)
+	}
+}
+
+// TestTranslationCacheSaveLoad tests that entries survive a Save/Load round trip
+func TestTranslationCacheSaveLoad(t *testing.T) {
+	cachePath := filepath.Join(t.TempDir(), "cache.json")
+
+	cache := NewTranslationCache(cachePath)
+	cache.Set("Introduction", "引言")
+	cache.Set("Conclusion", "结论")
+	if err := cache.Save(); err != nil {
+		t.Fatalf("Save failed: %v", err)
+	}
+
+	loaded := NewTranslationCache(cachePath)
+	if err := loaded.Load(); err != nil {
+		t.Fatalf("Load failed: %v", err)
+	}
+
+	if loaded.Size() != 2 {
+		t.Errorf("Size after Load = %d, want 2", loaded.Size())
+	}
+	if translation, ok := loaded.Get("Conclusion"); !ok || translation != "结论" {
+		t.Errorf("Get(Conclusion) = %q, %v, want %q, true", translation, ok, "结论")
+	}
+}
+
+// TestTranslationCacheSaveOnlyWhenDirty tests that Save skips writing when nothing changed
+func TestTranslationCacheSaveOnlyWhenDirty(t *testing.T) {
+	cachePath := filepath.Join(t.TempDir(), "cache.json")
+
+	cache := NewTranslationCache(cachePath)
+	if err := cache.Save(); err != nil {
+		t.Fatalf("Save failed: %v", err)
+	}
+	if _, err := os.Stat(cachePath); !os.IsNotExist(err) {
+		t.Error("Save should not write a file for an unchanged cache")
+	}
+
+	cache.Set("Abstract", "摘要")
+	if err := cache.Save(); err != nil {
+		t.Fatalf("Save failed: %v", err)
+	}
+	if _, err := os.Stat(cachePath); err != nil {
+		t.Errorf("Save should write the cache file after Set: %v", err)
+	}
+	if _, err := os.Stat(cachePath + ".tmp"); !os.IsNotExist(err) {
+		t.Error("Save should not leave the temporary file behind")
+	}
+
+	// Setting the same translation again does not make the cache dirty
+	if err := os.Remove(cachePath); err != nil {
+		t.Fatalf("Remove failed: %v", err)
+	}
+	cache.Set("Abstract", "摘要")
+	if err := cache.Save(); err != nil {
+		t.Fatalf("Save failed: %v", err)
+	}
+	if _, err := os.Stat(cachePath); !os.IsNotExist(err) {
+		t.Error("Save should not rewrite the cache when the translation is unchanged")
+	}
+}
+
+// TestTranslationCacheJournalReplay tests that translations appended to the journal
+// survive without a Save, and that Save folds them into the cache file
+func TestTranslationCacheJournalReplay(t *testing.T) {
+	cachePath := filepath.Join(t.TempDir(), "cache.json")
+	journalPath := cachePath + ".journal"
+
+	cache := NewTranslationCache(cachePath)
+	for i := 0; i < journalFlushInterval; i++ {
+		cache.Set(fmt.Sprintf("text %d", i), fmt.Sprintf("文本 %d", i))
+	}
+	if _, err := os.Stat(journalPath); err != nil {
+		t.Fatalf("journal should be written after %d entries: %v", journalFlushInterval, err)
+	}
+
+	// Simulate a crash in the middle of appending the next entry
+	f, err := os.OpenFile(journalPath, os.O_APPEND|os.O_WRONLY, 0644)
+	if err != nil {
+		t.Fatalf("OpenFile failed: %v", err)
+	}
+	f.WriteString(`{"hash":"abc","original":"trunc`)
+	f.Close()
+
+	// A new session recovers the journaled entries without a cache file
+	recovered := NewTranslationCache(cachePath)
+	if err := recovered.Load(); err != nil {
+		t.Fatalf("Load failed: %v", err)
+	}
+	if recovered.Size() != journalFlushInterval {
+		t.Errorf("Size after Load = %d, want %d", recovered.Size(), journalFlushInterval)
+	}
+	if translation, ok := recovered.Get("text 7"); !ok || translation != "文本 7" {
+		t.Errorf("Get(text 7) = %q, %v, want %q, true", translation, ok, "文本 7")
+	}
+
+	// Entries journaled after the recovery are not hidden behind the truncated line
+	for i := journalFlushInterval; i < 2*journalFlushInterval; i++ {
+		recovered.Set(fmt.Sprintf("text %d", i), fmt.Sprintf("文本 %d", i))
+	}
+	crashed := NewTranslationCache(cachePath)
+	if err := crashed.Load(); err != nil {
+		t.Fatalf("Load failed: %v", err)
+	}
+	if crashed.Size() != 2*journalFlushInterval {
+		t.Errorf("Size after second Load = %d, want %d", crashed.Size(), 2*journalFlushInterval)
+	}
+
+	if err := recovered.Save(); err != nil {
+		t.Fatalf("Save failed: %v", err)
+	}
+	if _, err := os.Stat(journalPath); !os.IsNotExist(err) {
+		t.Error("Save should remove the journal")
+	}
+
+	loaded := NewTranslationCache(cachePath)
+	if err := loaded.Load(); err != nil {
+		t.Fatalf("Load failed: %v", err)
+	}
+	if loaded.Size() != 2*journalFlushInterval {
+		t.Errorf("Size after Save and Load = %d, want %d", loaded.Size(), 2*journalFlushInterval)
+	}
+}
+
+// TestTranslationCacheNormalizesWhitespace tests that texts differing only in whitespace share an entry
+func TestTranslationCacheNormalizesWhitespace(t *testing.T) {
+	cache := NewTranslationCache("")
+	cache.Set("Deep  learning\nmodels", "深度学习模型")
+
+	for _, text := range []string{"Deep learning models", "  Deep learning models\n", "Deep\tlearning \n models"} {
+		if translation, ok := cache.Get(text); !ok || translation != "深度学习模型" {
+			t.Errorf("Get(%q) = %q, %v, want %q, true", text, translation, ok, "深度学习模型")
+		}
+	}
+	if _, ok := cache.Get("Deep learning model"); ok {
+		t.Error("Get should miss for a different text")
+	}
+	if cache.Size() != 1 {
+		t.Errorf("Size = %d, want 1", cache.Size())
+	}
+
+	for _, text := range []string{"", "a", "already normalized text"} {
+		if got := cacheKey(text); got != text {
+			t.Errorf("cacheKey(%q) = %q, want it unchanged", text, got)
+		}
+	}
+}
+
+// TestTranslationCacheClearRemovesJournal tests that cleared entries are not restored from the journal
+func TestTranslationCacheClearRemovesJournal(t *testing.T) {
+	cachePath := filepath.Join(t.TempDir(), "cache.json")
+
+	cache := NewTranslationCache(cachePath)
+	for i := 0; i < journalFlushInterval; i++ {
+		cache.Set(fmt.Sprintf("text %d", i), fmt.Sprintf("文本 %d", i))
+	}
+	cache.Clear()
+
+	loaded := NewTranslationCache(cachePath)
+	if err := loaded.Load(); err != nil {
+		t.Fatalf("Load failed: %v", err)
+	}
+	if loaded.Size() != 0 {
+		t.Errorf("Size after Clear and Load = %d, want 0", loaded.Size())
+	}
+}
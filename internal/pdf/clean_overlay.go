@@ -6,6 +6,7 @@ package pdf
 
 import (
 	"fmt"
+	"io"
 	"os"
 	"os/exec"
 	"path/filepath"
@@ -184,11 +185,24 @@ func (g *CleanOverlayGenerator) generateCleanOverlayLatex(
 // Helper functions
 
 func copyFileSimple(src, dst string) error {
-	input, err := os.ReadFile(src)
+	// Stream the copy instead of holding the whole PDF in memory
+	input, err := os.Open(src)
 	if err != nil {
 		return err
 	}
-	return os.WriteFile(dst, input, 0644)
+	defer input.Close()
+
+	output, err := os.Create(dst)
+	if err != nil {
+		return err
+	}
+
+	if _, err := io.Copy(output, input); err != nil {
+		output.Close()
+		return err
+	}
+	// Close flushes the file, its error must not be dropped
+	return output.Close()
 }
 
 func compileLatexInDir(dir, texFile string) error {
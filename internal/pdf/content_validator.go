@@ -56,29 +56,26 @@ func (v *ContentValidator) ValidateContent(originalPath, translatedPath string)
 		Score:      100.0,
 	}
 
-	// Step 1: Check page count difference
-	pageResult, err := v.translator.CheckPageCountDifference(originalPath, translatedPath)
-	if err != nil {
-		logger.Warn("failed to check page count", logger.Err(err))
-	} else {
-		result.PageCountResult = pageResult
-		if pageResult.IsSuspicious {
-			result.Warnings = append(result.Warnings, FormatPageCountError(pageResult))
-			result.Score -= 20.0 // Deduct 20 points for suspicious page count
-		}
-	}
-
-	// Step 2: Extract sections from both PDFs
-	originalBlocks, err := v.translator.ExtractBlocks(originalPath)
+	// Step 1: Extract blocks from both PDFs
+	// The extraction also reports the page counts, so the PDFs are not reopened just to count pages
+	originalBlocks, originalPages, err := v.translator.extractBlocks(originalPath)
 	if err != nil {
 		return nil, fmt.Errorf("failed to extract original PDF blocks: %w", err)
 	}
 
-	translatedBlocks, err := v.translator.ExtractBlocks(translatedPath)
+	translatedBlocks, translatedPages, err := v.translator.extractBlocks(translatedPath)
 	if err != nil {
 		return nil, fmt.Errorf("failed to extract translated PDF blocks: %w", err)
 	}
 
+	// Step 2: Check page count difference
+	pageResult := comparePageCounts(originalPages, translatedPages)
+	result.PageCountResult = pageResult
+	if pageResult.IsSuspicious {
+		result.Warnings = append(result.Warnings, FormatPageCountError(pageResult))
+		result.Score -= 20.0 // Deduct 20 points for suspicious page count
+	}
+
 	// Step 3: Extract section structure from blocks
 	result.OriginalSections = v.extractSections(originalBlocks)
 	result.TranslatedSections = v.extractSections(translatedBlocks)
@@ -138,46 +135,49 @@ func (v *ContentValidator) ValidateContent(originalPath, translatedPath string)
 }
 
 
+// sectionPatterns are the patterns for detecting sections - order matters! More specific patterns first.
+// Compiled once at package init instead of on every extractSections call.
+var sectionPatterns = []struct {
+	pattern *regexp.Regexp
+	sType   string
+	level   int
+}{
+	// Sub-subsections first (most specific): "1.1.1 Details"
+	{regexp.MustCompile(`^(\d+\.\d+\.\d+)\s*\.?\s+(.+)$`), "subsubsection", 3},
+
+	// Subsections: "1.1 Background", "1.1. Background"
+	{regexp.MustCompile(`^(\d+\.\d+)\s*\.?\s+(.+)$`), "subsection", 2},
+
+	// Numbered sections: "1 Introduction", "1. Introduction"
+	{regexp.MustCompile(`^(\d+)\s*\.?\s+(.+)$`), "section", 1},
+	{regexp.MustCompile(`^Section\s+(\d+)[:\s]*(.*)$`), "section", 1},
+
+	// Appendix subsections: "A.1 Details", "B.2 More"
+	{regexp.MustCompile(`^([A-Z]\.\d+)\s*\.?\s+(.+)$`), "appendix_subsection", 2},
+
+	// Appendix patterns: "Appendix A", "A. Appendix"
+	{regexp.MustCompile(`^Appendix\s+([A-Z])[:\s]*(.*)$`), "appendix", 1},
+	{regexp.MustCompile(`^([A-Z])\s*\.\s*Appendix[:\s]*(.*)$`), "appendix", 1},
+	{regexp.MustCompile(`^附录\s*([A-Z]?)[:\s]*(.*)$`), "appendix", 1},
+
+	// Special sections (exact match)
+	{regexp.MustCompile(`^Abstract$`), "abstract", 0},
+	{regexp.MustCompile(`^摘要$`), "abstract", 0},
+	{regexp.MustCompile(`^Introduction$`), "introduction", 1},
+	{regexp.MustCompile(`^引言$`), "introduction", 1},
+	{regexp.MustCompile(`^Conclusions?$`), "conclusion", 1},
+	{regexp.MustCompile(`^结论$`), "conclusion", 1},
+	{regexp.MustCompile(`^References?$`), "references", 1},
+	{regexp.MustCompile(`^参考文献$`), "references", 1},
+	{regexp.MustCompile(`^Acknowledgments?$`), "acknowledgments", 1},
+	{regexp.MustCompile(`^致谢$`), "acknowledgments", 1},
+}
+
 // extractSections extracts section information from PDF blocks
 func (v *ContentValidator) extractSections(blocks []BabelDocBlock) []SectionInfo {
 	var sections []SectionInfo
-
-	// Patterns for detecting sections - order matters! More specific patterns first
-	sectionPatterns := []struct {
-		pattern *regexp.Regexp
-		sType   string
-		level   int
-	}{
-		// Sub-subsections first (most specific): "1.1.1 Details"
-		{regexp.MustCompile(`^(\d+\.\d+\.\d+)\s*\.?\s+(.+)$`), "subsubsection", 3},
-
-		// Subsections: "1.1 Background", "1.1. Background"
-		{regexp.MustCompile(`^(\d+\.\d+)\s*\.?\s+(.+)$`), "subsection", 2},
-
-		// Numbered sections: "1 Introduction", "1. Introduction"
-		{regexp.MustCompile(`^(\d+)\s*\.?\s+(.+)$`), "section", 1},
-		{regexp.MustCompile(`^Section\s+(\d+)[:\s]*(.*)$`), "section", 1},
-
-		// Appendix subsections: "A.1 Details", "B.2 More"
-		{regexp.MustCompile(`^([A-Z]\.\d+)\s*\.?\s+(.+)$`), "appendix_subsection", 2},
-
-		// Appendix patterns: "Appendix A", "A. Appendix"
-		{regexp.MustCompile(`^Appendix\s+([A-Z])[:\s]*(.*)$`), "appendix", 1},
-		{regexp.MustCompile(`^([A-Z])\s*\.\s*Appendix[:\s]*(.*)$`), "appendix", 1},
-		{regexp.MustCompile(`^附录\s*([A-Z]?)[:\s]*(.*)$`), "appendix", 1},
-
-		// Special sections (exact match)
-		{regexp.MustCompile(`^Abstract$`), "abstract", 0},
-		{regexp.MustCompile(`^摘要$`), "abstract", 0},
-		{regexp.MustCompile(`^Introduction$`), "introduction", 1},
-		{regexp.MustCompile(`^引言$`), "introduction", 1},
-		{regexp.MustCompile(`^Conclusions?$`), "conclusion", 1},
-		{regexp.MustCompile(`^结论$`), "conclusion", 1},
-		{regexp.MustCompile(`^References?$`), "references", 1},
-		{regexp.MustCompile(`^参考文献$`), "references", 1},
-		{regexp.MustCompile(`^Acknowledgments?$`), "acknowledgments", 1},
-		{regexp.MustCompile(`^致谢$`), "acknowledgments", 1},
-	}
+	// Type+number of the sections found so far, for O(1) duplicate checks
+	seen := make(map[string]bool)
 
 	// Track if we're in appendix section
 	inAppendix := false
@@ -232,7 +232,10 @@ func (v *ContentValidator) extractSections(blocks []BabelDocBlock) []SectionInfo
 				}
 
 				// Avoid duplicates
-				if !v.sectionExists(sections, section) {
+				// A section with the same type and number (or an unnumbered one of the same type) is a duplicate
+				key := section.Type + ":" + section.Number
+				if !seen[key] {
+					seen[key] = true
 					sections = append(sections, section)
 				}
 				break
@@ -251,31 +254,18 @@ func (v *ContentValidator) extractSections(blocks []BabelDocBlock) []SectionInfo
 	return sections
 }
 
-// sectionExists checks if a similar section already exists
-func (v *ContentValidator) sectionExists(sections []SectionInfo, newSection SectionInfo) bool {
-	for _, s := range sections {
-		if s.Type == newSection.Type && s.Number == newSection.Number {
-			return true
-		}
-		// Also check by title similarity for unnumbered sections
-		if s.Type == newSection.Type && s.Number == "" && newSection.Number == "" {
-			if strings.EqualFold(s.Title, newSection.Title) {
-				return true
-			}
-		}
-	}
-	return false
-}
-
 // findMissingSections finds sections in original that are missing in translated
 func (v *ContentValidator) findMissingSections(original, translated []SectionInfo) []SectionInfo {
 	var missing []SectionInfo
 
-	// Create a map of translated sections for quick lookup
+	// Create a map of translated sections for quick lookup, plus an index by
+	// type so the fuzzy match only looks at candidates that can match at all
 	translatedMap := make(map[string]bool)
+	translatedByType := make(map[string][]SectionInfo)
 	for _, s := range translated {
 		key := v.sectionKey(s)
 		translatedMap[key] = true
+		translatedByType[s.Type] = append(translatedByType[s.Type], s)
 	}
 
 	// Find missing sections
@@ -283,8 +273,9 @@ func (v *ContentValidator) findMissingSections(original, translated []SectionInf
 		key := v.sectionKey(s)
 		if !translatedMap[key] {
 			// Also try to find by similar title (for translated titles)
+			// sectionsMatch requires equal types, so only same-type candidates are checked
 			found := false
-			for _, ts := range translated {
+			for _, ts := range translatedByType[s.Type] {
 				if v.sectionsMatch(s, ts) {
 					found = true
 					break
@@ -328,6 +319,30 @@ func (v *ContentValidator) sectionsMatch(original, translated SectionInfo) bool
 }
 
 
+// titleMappings holds common section title mappings (English -> Chinese)
+var titleMappings = map[string][]string{
+	"introduction":    {"引言", "介绍", "简介"},
+	"background":      {"背景", "研究背景"},
+	"related work":    {"相关工作", "相关研究"},
+	"method":          {"方法", "方法论"},
+	"methodology":     {"方法论", "研究方法"},
+	"experiment":      {"实验", "实验设置"},
+	"experiments":     {"实验", "实验结果"},
+	"results":         {"结果", "实验结果"},
+	"discussion":      {"讨论", "分析讨论"},
+	"conclusion":      {"结论", "总结"},
+	"conclusions":     {"结论", "总结"},
+	"abstract":        {"摘要"},
+	"references":      {"参考文献", "引用"},
+	"acknowledgments": {"致谢", "鸣谢"},
+	"appendix":        {"附录"},
+	"evaluation":      {"评估", "评价"},
+	"analysis":        {"分析"},
+	"implementation":  {"实现", "实施"},
+	"limitations":     {"局限性", "限制"},
+	"future work":     {"未来工作", "展望"},
+}
+
 // titlesSimilar checks if two titles are similar (one might be translated)
 func (v *ContentValidator) titlesSimilar(title1, title2 string) bool {
 	// Exact match
@@ -335,30 +350,6 @@ func (v *ContentValidator) titlesSimilar(title1, title2 string) bool {
 		return true
 	}
 
-	// Common section title mappings (English -> Chinese)
-	titleMappings := map[string][]string{
-		"introduction":    {"引言", "介绍", "简介"},
-		"background":      {"背景", "研究背景"},
-		"related work":    {"相关工作", "相关研究"},
-		"method":          {"方法", "方法论"},
-		"methodology":     {"方法论", "研究方法"},
-		"experiment":      {"实验", "实验设置"},
-		"experiments":     {"实验", "实验结果"},
-		"results":         {"结果", "实验结果"},
-		"discussion":      {"讨论", "分析讨论"},
-		"conclusion":      {"结论", "总结"},
-		"conclusions":     {"结论", "总结"},
-		"abstract":        {"摘要"},
-		"references":      {"参考文献", "引用"},
-		"acknowledgments": {"致谢", "鸣谢"},
-		"appendix":        {"附录"},
-		"evaluation":      {"评估", "评价"},
-		"analysis":        {"分析"},
-		"implementation":  {"实现", "实施"},
-		"limitations":     {"局限性", "限制"},
-		"future work":     {"未来工作", "展望"},
-	}
-
 	t1Lower := strings.ToLower(title1)
 	t2Lower := strings.ToLower(title2)
 
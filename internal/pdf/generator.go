@@ -1408,6 +1408,17 @@ func (g *PDFGenerator) adjustFontSizeForChinese(text string, originalSize, maxWi
 	return adjustedSize
 }
 
+// countCJKIdeographs counts the characters in the CJK Unified Ideographs block (U+4E00..U+9FFF)
+func countCJKIdeographs(text string) int {
+	count := 0
+	for _, r := range text {
+		if r >= 0x4E00 && r <= 0x9FFF {
+			count++
+		}
+	}
+	return count
+}
+
 // isChinese checks if a rune is a Chinese character
 func isChinese(r rune) bool {
 	// CJK Unified Ideographs range
@@ -11,6 +11,7 @@
 package pdf
 
 import (
+	"compress/zlib"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -22,19 +23,50 @@ import (
 	"latex-translator/internal/logger"
 )
 
+// Overlay drawing parameters shared by all blocks
+const (
+	overlayFontFamily  = "chinese" // family name the Chinese TTF font is registered under
+	overlayFontScale   = 0.85      // Chinese text is set slightly smaller to fit denser text
+	overlayMinFontSize = 6.0
+	overlayMaxFontSize = 14.0
+
+	overlayProgressInterval = 10 // log overlay progress every N pages
+)
+
+// overlayTextColor is the color of the translated text
+var overlayTextColor = [3]uint8{0, 0, 0}
+
 // GoPDF2Generator handles PDF translation overlay using GoPDF2 library
 type GoPDF2Generator struct {
-	workDir  string
-	fontPath string // path to Chinese TTF font
+	workDir       string
+	fontPath      string // path to Chinese TTF font
+	compressLevel int    // zlib level for content streams
 }
 
 // NewGoPDF2Generator creates a new GoPDF2 overlay generator
 func NewGoPDF2Generator(workDir string) *GoPDF2Generator {
 	return &GoPDF2Generator{
-		workDir: workDir,
+		workDir:       workDir,
+		compressLevel: overlayCompressLevel(false),
 	}
 }
 
+// SetCompressLevel sets the zlib compression level used when writing the PDF.
+// Defaults to zlib.BestSpeed; use zlib.BestCompression for final-delivery PDFs
+// where a smaller file is worth a slower save.
+func (g *GoPDF2Generator) SetCompressLevel(level int) {
+	g.compressLevel = level
+}
+
+// overlayCompressLevel returns the zlib level for the overlay output:
+// BestSpeed by default, BestCompression in final-delivery mode (Config.FinalDelivery)
+func overlayCompressLevel(finalDelivery bool) int {
+	if finalDelivery {
+		return zlib.BestCompression
+	}
+	return zlib.BestSpeed
+}
+
 // GenerateTranslatedPDF generates a translated PDF by:
 // 1. Importing each page from the original PDF
 // 2. For each translated block, drawing a white rectangle over the original text
@@ -52,6 +84,7 @@ func (g *GoPDF2Generator) GenerateTranslatedPDF(originalPath string, blocks []Tr
 		Unit:     gopdf.UnitPT,
 		PageSize: *gopdf.PageSizeA4,
 	})
+	p.SetCompressLevel(g.compressLevel)
 
 	pageSizes := p.GetPageSizes(originalPath)
 	if len(pageSizes) == 0 {
@@ -59,29 +92,46 @@ func (g *GoPDF2Generator) GenerateTranslatedPDF(originalPath string, blocks []Tr
 	}
 	numPages := len(pageSizes)
 
-	fontFamily, err := g.loadChineseFont(&p)
-	if err != nil {
-		return fmt.Errorf("failed to load Chinese font: %w", err)
-	}
-
-	// Group blocks by page — each block is overlaid independently
-	pageBlockMap := make(map[int][]TranslatedBlock)
+	// Group blocks by page — each block is overlaid independently.
+	// Pages are 1..numPages, so a slice indexed by page number replaces the map;
+	// blocks outside that range would never be visited anyway.
+	pageBlocks := make([][]TranslatedBlock, numPages+1)
 	for _, b := range blocks {
 		if b.TranslatedText == "" || b.BlockType == "formula" {
 			continue
 		}
-		pageBlockMap[b.Page] = append(pageBlockMap[b.Page], b)
+		if b.Page < 1 || b.Page > numPages {
+			continue
+		}
+		pageBlocks[b.Page] = append(pageBlocks[b.Page], b)
 	}
 
 	// Sort blocks on each page by Y descending (top of page first)
-	for pg := range pageBlockMap {
-		pbs := pageBlockMap[pg]
+	hasBlocks := false
+	for _, pbs := range pageBlocks {
+		if len(pbs) > 0 {
+			hasBlocks = true
+		}
+		if len(pbs) < 2 {
+			continue
+		}
 		sort.Slice(pbs, func(i, j int) bool {
 			return pbs[i].Y > pbs[j].Y
 		})
-		pageBlockMap[pg] = pbs
 	}
 
+	// The Chinese font is only embedded when some block will actually be rendered;
+	// parsing a large CJK TTF is wasted work for a PDF with nothing to overlay
+	fontFamily := ""
+	if hasBlocks {
+		var err error
+		fontFamily, err = g.loadChineseFont(&p)
+		if err != nil {
+			return fmt.Errorf("failed to load Chinese font: %w", err)
+		}
+	}
+
+	totalOverlaid := 0
 	for pageNum := 1; pageNum <= numPages; pageNum++ {
 		mediaBox, ok := pageSizes[pageNum]["/MediaBox"]
 		if !ok {
@@ -97,30 +147,17 @@ func (g *GoPDF2Generator) GenerateTranslatedPDF(originalPath string, blocks []Tr
 		tpl := p.ImportPage(originalPath, pageNum, "/MediaBox")
 		p.UseImportedTemplate(tpl, 0, 0, pageW, pageH)
 
-		pbs, hasBlocks := pageBlockMap[pageNum]
-		if !hasBlocks || len(pbs) == 0 {
-			continue
-		}
-
-		// Pass 1: white rectangles to cover all original text
-		for _, b := range pbs {
-			g.drawWhiteRect(&p, b, pageH, pageW)
-		}
-
-		// Pass 2: render translated text
-		overlaid := 0
-		for _, b := range pbs {
-			if err := g.overlayBlock(&p, b, fontFamily, pageH, pageW); err != nil {
-				logger.Warn("overlay block failed",
-					logger.Int("page", pageNum),
-					logger.String("id", b.ID),
-					logger.Err(err))
-			} else {
-				overlaid++
-			}
+		overlaid := g.overlayPage(&p, pageNum, pageBlocks[pageNum], fontFamily, pageH, pageW)
+		totalOverlaid += overlaid
+		logger.Debug("page overlaid",
+			logger.Int("page", pageNum),
+			logger.Int("blocks", overlaid))
+		if pageNum%overlayProgressInterval == 0 {
+			logger.Info("overlay progress",
+				logger.Int("page", pageNum),
+				logger.Int("totalPages", numPages),
+				logger.Int("blocks", totalOverlaid))
 		}
-
-		fmt.Printf("  Page %d: done (%d blocks)\n", pageNum, overlaid)
 	}
 
 	if err := p.WritePdf(outputPath); err != nil {
@@ -128,10 +165,54 @@ func (g *GoPDF2Generator) GenerateTranslatedPDF(originalPath string, blocks []Tr
 	}
 
 	logger.Info("translated PDF generated successfully",
-		logger.String("output", outputPath))
+		logger.String("output", outputPath),
+		logger.Int("pages", numPages),
+		logger.Int("overlaidBlocks", totalOverlaid))
 	return nil
 }
 
+// overlayPage covers the original text of a page's blocks and renders their translations.
+// Returns the number of blocks overlaid.
+func (g *GoPDF2Generator) overlayPage(p *gopdf.GoPdf, pageNum int, blocks []TranslatedBlock, fontFamily string, pageH, pageW float64) int {
+	// Compute each block's rectangle once, up front: only blocks with a usable rectangle
+	// on this page are drawn, so the overlay pass below can only fail inside InsertHTMLBox
+	rects := make([]overlayRect, 0, len(blocks))
+	for _, b := range blocks {
+		if x, y, w, h, ok := g.blockRect(b, pageH, pageW); ok {
+			rects = append(rects, overlayRect{block: b, x: x, y: y, w: w, h: h})
+		}
+	}
+	if len(rects) == 0 {
+		return 0
+	}
+
+	// Pass 1: white rectangles to cover all original text (fill color set once per page)
+	p.SetFillColor(255, 255, 255)
+	for _, r := range rects {
+		g.drawWhiteRect(p, r, pageH, pageW)
+	}
+
+	// Pass 2: render translated text
+	overlaid := 0
+	for _, r := range rects {
+		if err := g.overlayBlock(p, r, fontFamily, pageH); err != nil {
+			logger.Warn("overlay block failed",
+				logger.Int("page", pageNum),
+				logger.String("id", r.block.ID),
+				logger.Err(err))
+		} else {
+			overlaid++
+		}
+	}
+	return overlaid
+}
+
+// overlayRect is a block with its GoPDF2 rectangle, as computed by blockRect
+type overlayRect struct {
+	block      TranslatedBlock
+	x, y, w, h float64
+}
+
 // blockRect computes the GoPDF2 rectangle (top-left origin) for a TranslatedBlock.
 // Returns x, y, w, h in GoPDF2 coordinates, and whether the block is valid.
 func (g *GoPDF2Generator) blockRect(b TranslatedBlock, pageH, pageW float64) (x, y, w, h float64, ok bool) {
@@ -174,17 +255,14 @@ func (g *GoPDF2Generator) blockRect(b TranslatedBlock, pageH, pageW float64) (x,
 }
 
 // drawWhiteRect draws a white rectangle to cover the original text of a block.
-func (g *GoPDF2Generator) drawWhiteRect(p *gopdf.GoPdf, b TranslatedBlock, pageH, pageW float64) {
-	x, y, w, h, ok := g.blockRect(b, pageH, pageW)
-	if !ok {
-		return
-	}
+// The caller sets the white fill color once before drawing the rectangles of a page.
+func (g *GoPDF2Generator) drawWhiteRect(p *gopdf.GoPdf, r overlayRect, pageH, pageW float64) {
 	// Add small padding to ensure full coverage
 	pad := 1.0
-	rx := x - pad
-	ry := y - pad
-	rw := w + pad*2
-	rh := h + pad*2
+	rx := r.x - pad
+	ry := r.y - pad
+	rw := r.w + pad*2
+	rh := r.h + pad*2
 	if rx < 0 {
 		rx = 0
 	}
@@ -198,28 +276,25 @@ func (g *GoPDF2Generator) drawWhiteRect(p *gopdf.GoPdf, b TranslatedBlock, pageH
 		rh = pageH - ry
 	}
 
-	p.SetFillColor(255, 255, 255)
 	p.RectFromUpperLeftWithStyle(rx, ry, rw, rh, "F")
 }
 
 // overlayBlock renders translated text into the block's position.
-func (g *GoPDF2Generator) overlayBlock(p *gopdf.GoPdf, b TranslatedBlock, fontFamily string, pageH, pageW float64) error {
-	x, y, w, h, ok := g.blockRect(b, pageH, pageW)
-	if !ok {
-		return nil
-	}
+func (g *GoPDF2Generator) overlayBlock(p *gopdf.GoPdf, r overlayRect, fontFamily string, pageH float64) error {
+	b := r.block
+	x, y, w, h := r.x, r.y, r.w, r.h
 
 	// Calculate Chinese font size (slightly smaller to fit denser text)
 	fontSize := b.FontSize
 	if fontSize <= 0 {
 		fontSize = 10
 	}
-	cnFontSize := fontSize * 0.85
-	if cnFontSize < 6 {
-		cnFontSize = 6
+	cnFontSize := fontSize * overlayFontScale
+	if cnFontSize < overlayMinFontSize {
+		cnFontSize = overlayMinFontSize
 	}
-	if cnFontSize > 14 {
-		cnFontSize = 14
+	if cnFontSize > overlayMaxFontSize {
+		cnFontSize = overlayMaxFontSize
 	}
 
 	// Estimate needed height for the translated text
@@ -255,7 +330,7 @@ func (g *GoPDF2Generator) overlayBlock(p *gopdf.GoPdf, b TranslatedBlock, fontFa
 	_, err := p.InsertHTMLBox(x, y, w, boxH, htmlContent, gopdf.HTMLBoxOption{
 		DefaultFontFamily: fontFamily,
 		DefaultFontSize:   cnFontSize,
-		DefaultColor:      [3]uint8{0, 0, 0},
+		DefaultColor:      overlayTextColor,
 	})
 	if err != nil {
 		return fmt.Errorf("InsertHTMLBox failed: %w", err)
@@ -277,22 +352,22 @@ func (g *GoPDF2Generator) buildHTML(text string, fontSize float64) string {
 // loadChineseFont finds and loads a Chinese TTF font into the GoPDF2 instance.
 func (g *GoPDF2Generator) loadChineseFont(pdf *gopdf.GoPdf) (string, error) {
 	if g.fontPath != "" {
-		if err := pdf.AddTTFFont("chinese", g.fontPath); err != nil {
+		if err := pdf.AddTTFFont(overlayFontFamily, g.fontPath); err != nil {
 			return "", fmt.Errorf("failed to load font %s: %w", g.fontPath, err)
 		}
-		return "chinese", nil
+		return overlayFontFamily, nil
 	}
 
 	fontPaths := g.getSystemChineseFontPaths()
 	for _, fp := range fontPaths {
 		if _, err := os.Stat(fp); err == nil {
-			if err := pdf.AddTTFFont("chinese", fp); err != nil {
+			if err := pdf.AddTTFFont(overlayFontFamily, fp); err != nil {
 				logger.Warn("failed to load font, trying next",
 					logger.String("font", fp), logger.Err(err))
 				continue
 			}
 			logger.Info("loaded Chinese font", logger.String("path", fp))
-			return "chinese", nil
+			return overlayFontFamily, nil
 		}
 	}
 
@@ -302,9 +377,9 @@ func (g *GoPDF2Generator) loadChineseFont(pdf *gopdf.GoPdf) (string, error) {
 	}
 	for _, fp := range localFonts {
 		if _, err := os.Stat(fp); err == nil {
-			if err := pdf.AddTTFFont("chinese", fp); err == nil {
+			if err := pdf.AddTTFFont(overlayFontFamily, fp); err == nil {
 				logger.Info("loaded local Chinese font", logger.String("path", fp))
-				return "chinese", nil
+				return overlayFontFamily, nil
 			}
 		}
 	}
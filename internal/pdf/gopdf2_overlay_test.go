@@ -0,0 +1,35 @@
+package pdf
+
+import (
+	"compress/zlib"
+	"testing"
+
+	"latex-translator/internal/types"
+)
+
+// TestFinalDeliveryReachesGoPDF2Generator tests that the final_delivery setting
+// selects the compression level of the GoPDF2 generator
+func TestFinalDeliveryReachesGoPDF2Generator(t *testing.T) {
+	tests := []struct {
+		name          string
+		finalDelivery bool
+		want          int
+	}{
+		{"default", false, zlib.BestSpeed},
+		{"final delivery", true, zlib.BestCompression},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			translator := NewBabelDocPDFTranslator(BabelDocPDFTranslatorConfig{
+				Config:  &types.Config{FinalDelivery: tt.finalDelivery},
+				WorkDir: t.TempDir(),
+			})
+			defer translator.Close()
+
+			if got := translator.translator.newGoPDF2Generator().compressLevel; got != tt.want {
+				t.Errorf("compressLevel = %d, want %d", got, tt.want)
+			}
+		})
+	}
+}
@@ -4,7 +4,10 @@ package pdf
 import (
 	"fmt"
 	_ "image/png" // register PNG decoder
+	"os"
 	"path/filepath"
+	"sync"
+	"time"
 
 	"latex-translator/internal/logger"
 )
@@ -48,6 +51,12 @@ type LayoutDetector struct {
 	engine  *ONNXEngine
 	enabled bool
 	workDir string
+
+	// 规则检测的文本块缓存：整个 PDF 只解析一次，按页复用
+	mu             sync.Mutex
+	ruleSource     string
+	ruleModTime    time.Time
+	ruleBlocksPage map[int][]TextBlock
 }
 
 // LayoutDetectorConfig holds configuration for layout detector
@@ -162,17 +171,13 @@ func (d *LayoutDetector) detectLayoutRuleBased(pdfPath string, pageNum int) ([]L
 		logger.String("pdf", filepath.Base(pdfPath)),
 		logger.Int("page", pageNum))
 
-	parser := NewPDFParser("")
-	textBlocks, err := parser.ExtractText(pdfPath)
+	pageBlocks, err := d.ruleBasedBlocks(pdfPath)
 	if err != nil {
-		return nil, fmt.Errorf("failed to extract text: %w", err)
+		return nil, err
 	}
 
 	var elements []LayoutElement
-	for _, block := range textBlocks {
-		if block.Page != pageNum {
-			continue
-		}
+	for _, block := range pageBlocks[pageNum] {
 		elements = append(elements, LayoutElement{
 			Type: ElementType(block.BlockType),
 			BoundingBox: BoundingBox{
@@ -192,6 +197,39 @@ func (d *LayoutDetector) detectLayoutRuleBased(pdfPath string, pageNum int) ([]L
 	return elements, nil
 }
 
+// ruleBasedBlocks returns the text blocks of pdfPath grouped by page.
+// The PDF is parsed once and the result is reused for the following pages,
+// instead of re-parsing the whole document for every page.
+func (d *LayoutDetector) ruleBasedBlocks(pdfPath string) (map[int][]TextBlock, error) {
+	var modTime time.Time
+	if info, err := os.Stat(pdfPath); err == nil {
+		modTime = info.ModTime()
+	}
+
+	d.mu.Lock()
+	defer d.mu.Unlock()
+
+	if d.ruleBlocksPage != nil && d.ruleSource == pdfPath && d.ruleModTime.Equal(modTime) {
+		return d.ruleBlocksPage, nil
+	}
+
+	parser := NewPDFParser("")
+	textBlocks, err := parser.ExtractText(pdfPath)
+	if err != nil {
+		return nil, fmt.Errorf("failed to extract text: %w", err)
+	}
+
+	pageBlocks := make(map[int][]TextBlock)
+	for _, block := range textBlocks {
+		pageBlocks[block.Page] = append(pageBlocks[block.Page], block)
+	}
+
+	d.ruleSource = pdfPath
+	d.ruleModTime = modTime
+	d.ruleBlocksPage = pageBlocks
+	return pageBlocks, nil
+}
+
 // IsTranslatable returns whether an element type should be translated
 func (e ElementType) IsTranslatable() bool {
 	switch e {
@@ -9,6 +9,7 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 
 	"latex-translator/internal/logger"
 	"latex-translator/internal/mupdf"
@@ -108,8 +109,9 @@ func (g *MuPDFGenerator) GenerateTranslatedPDF(originalPath string, blocks []Tra
 		}
 	}
 
-	// Save the modified document
-	if err := doc.Save(outputPath); err != nil {
+	// Save the modified copy incrementally: only the changed pages are appended,
+	// the original content is not rewritten
+	if err := doc.SaveIncremental(outputPath); err != nil {
 		return NewPDFError(ErrGenerateFailed, "failed to save translated PDF", err)
 	}
 
@@ -128,6 +130,15 @@ func (g *MuPDFGenerator) GenerateTranslatedPDF(originalPath string, blocks []Tra
 
 // processPage processes a single page, adding translated text overlays
 func (g *MuPDFGenerator) processPage(doc *mupdf.PDFDocument, pageNum int, blocks []TranslatedBlock) error {
+	// 先计算所有块的位置，再一次性添加所有白色遮盖矩形（一个内容流），最后逐块添加译文
+	type blockLayout struct {
+		x, y, h  float64
+		fontSize float64
+		text     string
+	}
+	layouts := make([]blockLayout, 0, len(blocks))
+	rects := make([]mupdf.Rect, 0, len(blocks))
+
 	for _, block := range blocks {
 		if block.TranslatedText == "" {
 			continue
@@ -155,25 +166,29 @@ func (g *MuPDFGenerator) processPage(doc *mupdf.PDFDocument, pageNum int, blocks
 		// Adjust font size for Chinese text
 		fontSize := g.adjustFontSizeForChinese(block.TranslatedText, block.FontSize, w)
 
-		// Add white rectangle to cover original text
-		// Add some padding
+		// White rectangle to cover original text, with some padding
 		padding := 2.0
-		if err := doc.AddRect(pageNum, x-padding, y-padding, w+padding*2, h+padding*2, 1.0, 1.0, 1.0); err != nil {
-			logger.Warn("failed to add cover rectangle",
-				logger.Int("page", pageNum),
-				logger.Err(err))
-			continue
-		}
+		rects = append(rects, mupdf.Rect{X: x - padding, Y: y - padding, W: w + padding*2, H: h + padding*2})
+		layouts = append(layouts, blockLayout{x: x, y: y, h: h, fontSize: fontSize, text: block.TranslatedText})
+	}
 
+	if err := doc.AddRects(pageNum, rects, 1.0, 1.0, 1.0); err != nil {
+		logger.Warn("failed to add cover rectangles",
+			logger.Int("page", pageNum),
+			logger.Err(err))
+		return nil
+	}
+
+	for _, l := range layouts {
 		// Add translated text
 		// Note: MuPDF Y coordinate is from bottom, adjust for text baseline
-		textY := y + h - fontSize
+		textY := l.y + l.h - l.fontSize
 		
 		// For now, use ASCII-safe text (MuPDF base14 fonts don't support CJK)
 		// TODO: Add CJK font embedding support
-		displayText := g.toASCIISafe(block.TranslatedText)
+		displayText := g.toASCIISafe(l.text)
 		
-		if err := doc.AddText(pageNum, displayText, x, textY, fontSize, ""); err != nil {
+		if err := doc.AddText(pageNum, displayText, l.x, textY, l.fontSize, ""); err != nil {
 			logger.Warn("failed to add translated text",
 				logger.Int("page", pageNum),
 				logger.Err(err))
@@ -195,12 +210,7 @@ func (g *MuPDFGenerator) groupBlocksByPage(blocks []TranslatedBlock) map[int][]T
 // adjustFontSizeForChinese adjusts font size for Chinese text to fit width
 func (g *MuPDFGenerator) adjustFontSizeForChinese(text string, originalSize, width float64) float64 {
 	// Count Chinese characters
-	chineseCount := 0
-	for _, r := range text {
-		if r >= 0x4E00 && r <= 0x9FFF {
-			chineseCount++
-		}
-	}
+	chineseCount := countCJKIdeographs(text)
 
 	if chineseCount == 0 {
 		return originalSize
@@ -258,15 +268,22 @@ func (g *MuPDFGenerator) copyFile(src, dst string) error {
 // ExtractTextBlocksWithMuPDF extracts text blocks from PDF using MuPDF
 // This provides more accurate extraction than ledongthuc/pdf
 func ExtractTextBlocksWithMuPDF(pdfPath string) ([]TextBlock, error) {
+	blocks, _, err := extractTextBlocksWithMuPDF(pdfPath, 1)
+	return blocks, err
+}
+
+// extractTextBlocksWithMuPDF is ExtractTextBlocksWithMuPDF that also returns the page count,
+// extracting the pages with the given number of workers (see extractMuPDFPages)
+func extractTextBlocksWithMuPDF(pdfPath string, workers int) ([]TextBlock, int, error) {
 	ctx, err := mupdf.NewContext()
 	if err != nil {
-		return nil, fmt.Errorf("failed to create MuPDF context: %w", err)
+		return nil, 0, fmt.Errorf("failed to create MuPDF context: %w", err)
 	}
 	defer ctx.Close()
 
 	doc, err := ctx.OpenDocument(pdfPath)
 	if err != nil {
-		return nil, fmt.Errorf("failed to open document: %w", err)
+		return nil, 0, fmt.Errorf("failed to open document: %w", err)
 	}
 	defer doc.Close()
 
@@ -274,15 +291,8 @@ func ExtractTextBlocksWithMuPDF(pdfPath string) ([]TextBlock, error) {
 	blockID := 0
 
 	pageCount := doc.PageCount()
-	for pageNum := 0; pageNum < pageCount; pageNum++ {
-		mupdfBlocks, err := doc.ExtractTextBlocks(pageNum)
-		if err != nil {
-			logger.Warn("failed to extract blocks from page",
-				logger.Int("page", pageNum),
-				logger.Err(err))
-			continue
-		}
-
+	pageBlocks := extractMuPDFPages(pdfPath, doc, workers)
+	for pageNum, mupdfBlocks := range pageBlocks {
 		for _, mb := range mupdfBlocks {
 			blockID++
 			
@@ -307,7 +317,69 @@ func ExtractTextBlocksWithMuPDF(pdfPath string) ([]TextBlock, error) {
 		logger.Int("totalBlocks", len(allBlocks)),
 		logger.Int("totalPages", pageCount))
 
-	return allBlocks, nil
+	return allBlocks, pageCount, nil
+}
+
+// extractMuPDFPages extracts the text blocks of every page of an open document,
+// indexed by 0-based page number. Pages are spread over the configured number of
+// worker goroutines (the same extract_workers setting as the ledongthuc/pdf path,
+// default 1). A MuPDF context must not be shared between threads, so each extra
+// worker opens its own context and document, with its own resource store;
+// the first worker reuses doc.
+func extractMuPDFPages(pdfPath string, doc *mupdf.Document, workers int) [][]mupdf.TextBlock {
+	pageCount := doc.PageCount()
+	pageBlocks := make([][]mupdf.TextBlock, pageCount)
+
+	workers = extractWorkerCount(workers)
+	if workers > pageCount {
+		workers = pageCount
+	}
+
+	docs := []*mupdf.Document{doc}
+	for len(docs) < workers {
+		ctx, err := mupdf.NewContext()
+		if err != nil {
+			logger.Warn("failed to create MuPDF context for extraction worker", logger.Err(err))
+			break
+		}
+		workerDoc, err := ctx.OpenDocument(pdfPath)
+		if err != nil {
+			ctx.Close()
+			logger.Warn("failed to open PDF for extraction worker", logger.Err(err))
+			break
+		}
+		// Deferred calls run in reverse order, so the document is closed before its context
+		defer ctx.Close()
+		defer workerDoc.Close()
+		docs = append(docs, workerDoc)
+	}
+
+	pages := make(chan int, pageCount)
+	for pageNum := 0; pageNum < pageCount; pageNum++ {
+		pages <- pageNum
+	}
+	close(pages)
+
+	var wg sync.WaitGroup
+	for _, workerDoc := range docs {
+		wg.Add(1)
+		go func(d *mupdf.Document) {
+			defer wg.Done()
+			for pageNum := range pages {
+				blocks, err := d.ExtractTextBlocks(pageNum)
+				if err != nil {
+					logger.Warn("failed to extract blocks from page",
+						logger.Int("page", pageNum),
+						logger.Err(err))
+					continue
+				}
+				pageBlocks[pageNum] = blocks
+			}
+		}(workerDoc)
+	}
+	wg.Wait()
+
+	return pageBlocks
 }
 
 // determineBlockTypeFromText determines block type based on text content
@@ -328,10 +400,9 @@ func determineBlockTypeFromText(text string, fontSize float64) string {
 	}
 
 	// Check for caption
-	textLower := strings.ToLower(text)
-	if strings.HasPrefix(textLower, "figure") ||
-		strings.HasPrefix(textLower, "table") ||
-		strings.HasPrefix(textLower, "fig.") {
+	if hasPrefixFold(text, "figure") ||
+		hasPrefixFold(text, "table") ||
+		hasPrefixFold(text, "fig.") {
 		return "caption"
 	}
 
@@ -31,6 +31,11 @@ func ExtractTextBlocksWithMuPDF(pdfPath string) ([]TextBlock, error) {
 	return nil, errors.New("MuPDF not available: build with -tags mupdf")
 }
 
+// extractTextBlocksWithMuPDF returns error when MuPDF is not available
+func extractTextBlocksWithMuPDF(pdfPath string, workers int) ([]TextBlock, int, error) {
+	return nil, 0, errors.New("MuPDF not available: build with -tags mupdf")
+}
+
 // IsMuPDFAvailable returns false when MuPDF is not compiled in
 func IsMuPDFAvailable() bool {
 	return false
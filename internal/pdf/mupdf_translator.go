@@ -5,9 +5,11 @@ package pdf
 
 import (
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
 	"strings"
+	"unicode/utf8"
 
 	"latex-translator/internal/logger"
 	"latex-translator/internal/mupdf"
@@ -102,21 +104,9 @@ func (t *MuPDFTranslator) TranslatePDF(inputPath, outputPath string, progressCal
 		progressCallback("extracting", 10)
 	}
 
+	// Pages are extracted in parallel, then flattened in page order
 	var allBlocks []mupdf.TextBlock
-	pageCount := doc.PageCount()
-	
-	for pageNum := 0; pageNum < pageCount; pageNum++ {
-		blocks, err := doc.ExtractTextBlocks(pageNum)
-		if err != nil {
-			logger.Warn("failed to extract blocks from page",
-				logger.Int("page", pageNum),
-				logger.Err(err))
-			continue
-		}
-		
-		for i := range blocks {
-			blocks[i].Page = pageNum
-		}
+	for _, blocks := range extractMuPDFPages(inputPath, doc, extractWorkerCount(configExtractWorkers(t.config))) {
 		allBlocks = append(allBlocks, blocks...)
 	}
 
@@ -126,14 +116,14 @@ func (t *MuPDFTranslator) TranslatePDF(inputPath, outputPath string, progressCal
 	var translatableBlocks []mupdf.TextBlock
 	formulaCount := 0
 	
+	// Classify every block in a single pass, each check runs at most once per block
 	for _, block := range allBlocks {
-		if !shouldTranslateBlock(block.Text) {
-			if isFormula(block.Text) {
-				formulaCount++
-			}
-			continue
+		switch classifyBlock(block.Text) {
+		case blockTranslatable:
+			translatableBlocks = append(translatableBlocks, block)
+		case blockFormula:
+			formulaCount++
 		}
-		translatableBlocks = append(translatableBlocks, block)
 	}
 
 	logger.Info("filtered blocks",
@@ -224,18 +214,27 @@ func (t *MuPDFTranslator) TranslatePDF(inputPath, outputPath string, progressCal
 		return nil, fmt.Errorf("failed to open PDF for modification: %w", err)
 	}
 
-	// Apply translations
+	// Cover original text with white rectangles, one content stream per page
+	pageRects := make(map[int][]mupdf.Rect)
 	for i, block := range translatableBlocks {
-		translated, ok := translations[i]
-		if !ok || translated == "" {
-			continue
+		if translated, ok := translations[i]; ok && translated != "" {
+			pageRects[block.Page] = append(pageRects[block.Page], mupdf.Rect{X: block.X, Y: block.Y, W: block.Width, H: block.Height})
 		}
-
-		// Cover original text with white rectangle
-		if err := pdfDoc.AddRect(block.Page, block.X, block.Y, block.Width, block.Height, 1, 1, 1); err != nil {
-			logger.Warn("failed to add rect",
-				logger.Int("page", block.Page),
+	}
+	failedPages := make(map[int]bool)
+	for page, rects := range pageRects {
+		if err := pdfDoc.AddRects(page, rects, 1, 1, 1); err != nil {
+			logger.Warn("failed to add rects",
+				logger.Int("page", page),
 				logger.Err(err))
+			failedPages[page] = true
+		}
+	}
+
+	// Apply translations
+	for i, block := range translatableBlocks {
+		translated, ok := translations[i]
+		if !ok || translated == "" || failedPages[block.Page] {
 			continue
 		}
 
@@ -281,92 +280,177 @@ func (t *MuPDFTranslator) TranslatePDF(inputPath, outputPath string, progressCal
 	return result, nil
 }
 
+// blockClass is the classification result of a text block
+type blockClass int
+
+const (
+	blockSkipped      blockClass = iota // Not translated (too short, line numbers, mostly symbols)
+	blockTranslatable                   // Regular text to translate
+	blockFormula                        // Mathematical formula, kept as is
+)
+
 // shouldTranslateBlock determines if a text block should be translated
 func shouldTranslateBlock(text string) bool {
+	return classifyBlock(text) == blockTranslatable
+}
+
+// classifyBlock classifies a text block as translatable, formula or skipped
+// The character counts are gathered in a single pass over the text, and the
+// cheap ratio checks run before the line-by-line isLineNumbers scan
+func classifyBlock(text string) blockClass {
 	text = strings.TrimSpace(text)
-	
+	stats := scanBlockText(text)
+	formula := stats.isFormula(len(text))
+
 	if len(text) < 3 {
-		return false
+		if formula {
+			return blockFormula
+		}
+		return blockSkipped
 	}
 
-	// Skip line numbers
-	if isLineNumbers(text) {
-		return false
+	// Skip if mostly numbers/symbols
+	// Line numbers are skipped as well, so the order does not matter for non-formulas
+	if !formula && float64(stats.alphaCount)/float64(len(text)) < 0.3 {
+		return blockSkipped
+	}
+
+	// Skip line numbers (checked before formulas, a formula next to line numbers is skipped)
+	if stats.mayBeLineNumbers() && isLineNumbers(text) {
+		return blockSkipped
 	}
 
 	// Skip formulas
-	if isFormula(text) {
-		return false
+	if formula {
+		return blockFormula
 	}
 
-	// Skip if mostly numbers/symbols
-	alphaCount := 0
-	for _, r := range text {
-		if (r >= 'a' && r <= 'z') || (r >= 'A' && r <= 'Z') {
-			alphaCount++
+	return blockTranslatable
+}
+
+// blockTextStats holds the character counts used to classify a block
+type blockTextStats struct {
+	alphaCount      int  // ASCII letters
+	mathCount       int  // ASCII operators and Unicode math symbols
+	digitCount      int  // ASCII digits
+	newlineCount    int  // '\n' characters
+	hasStrongSymbol bool // contains a symbol from strongMathSymbolSet
+}
+
+// scanBlockText gathers blockTextStats in one pass over text.
+// ASCII bytes are classified directly; only non-ASCII runes are decoded and looked up.
+func scanBlockText(text string) blockTextStats {
+	var stats blockTextStats
+	for i := 0; i < len(text); {
+		c := text[i]
+		if c < utf8.RuneSelf {
+			switch {
+			case (c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z'):
+				stats.alphaCount++
+			case c >= '0' && c <= '9':
+				stats.digitCount++
+			case c == '\n':
+				stats.newlineCount++
+			case c == '+' || c == '-' || c == '*' || c == '/' || c == '=' || c == '<' || c == '>' || c == '^' || c == '_':
+				stats.mathCount++
+			}
+			i++
+			continue
+		}
+
+		r, size := utf8.DecodeRuneInString(text[i:])
+		if strongMathSymbolSet[r] {
+			stats.hasStrongSymbol = true
+		}
+		if mathSymbolSet[r] {
+			stats.mathCount++
 		}
+		i += size
 	}
-	if len(text) > 0 && float64(alphaCount)/float64(len(text)) < 0.3 {
-		return false
+	return stats
+}
+
+// isFormula reports whether the stats of a text of textLen bytes mark it as a formula
+func (s blockTextStats) isFormula(textLen int) bool {
+	if textLen > 0 && float64(s.mathCount)/float64(textLen) > 0.25 {
+		return true
 	}
+	return s.hasStrongSymbol
+}
 
-	return true
+// mayBeLineNumbers reports whether the stats of a trimmed text allow isLineNumbers to match:
+// it needs at least 3 lines, and more than 70% of them holding at least one digit
+func (s blockTextStats) mayBeLineNumbers() bool {
+	totalLines := s.newlineCount + 1
+	return totalLines >= 3 && float64(s.digitCount)/float64(totalLines) > 0.7
 }
 
 // isLineNumbers checks if text is just line numbers
 func isLineNumbers(text string) bool {
-	lines := strings.Split(strings.TrimSpace(text), "\n")
-	if len(lines) < 3 {
+	text = strings.TrimSpace(text)
+	totalLines := strings.Count(text, "\n") + 1
+	if totalLines < 3 {
 		return false
 	}
 
+	// Walk the lines without splitting, and stop as soon as
+	// more than 70% number lines is no longer reachable
 	numberLines := 0
-	for _, line := range lines {
+	nonNumberLines := 0
+	for numberLines+nonNumberLines < totalLines {
+		line := text
+		if i := strings.IndexByte(text, '\n'); i >= 0 {
+			line, text = text[:i], text[i+1:]
+		} else {
+			text = ""
+		}
+
 		line = strings.TrimSpace(line)
-		isNum := true
-		for _, r := range line {
-			if r < '0' || r > '9' {
+		isNum := line != ""
+		for i := 0; i < len(line); i++ {
+			if line[i] < '0' || line[i] > '9' {
 				isNum = false
 				break
 			}
 		}
-		if isNum && line != "" {
+		if isNum {
 			numberLines++
+		} else {
+			nonNumberLines++
+			if float64(totalLines-nonNumberLines)/float64(totalLines) <= 0.7 {
+				return false
+			}
 		}
 	}
 
-	return float64(numberLines)/float64(len(lines)) > 0.7
+	return float64(numberLines)/float64(totalLines) > 0.7
 }
 
 // isFormula checks if text is a mathematical formula
 func isFormula(text string) bool {
-	mathSymbols := "∫∑∏√∂∇±×÷≤≥≠≈∞∈∉⊂⊃∪∩∧∨¬∀∃αβγδεζηθικλμνξοπρστυφχψω"
-	
-	mathCount := 0
-	for _, r := range text {
-		if strings.ContainsRune(mathSymbols, r) || r == '+' || r == '-' || r == '*' || r == '/' || r == '=' || r == '<' || r == '>' || r == '^' || r == '_' {
-			mathCount++
-		}
-	}
+	return scanBlockText(text).isFormula(len(text))
+}
 
-	if len(text) > 0 && float64(mathCount)/float64(len(text)) > 0.25 {
-		return true
+// copyFile copies a file.
+// It streams instead of reading the whole PDF into memory, so large inputs are not buffered twice.
+func copyFile(src, dst string) error {
+	sourceFile, err := os.Open(src)
+	if err != nil {
+		return err
 	}
+	defer sourceFile.Close()
 
-	if strings.ContainsAny(text, "∫∑∏√∂∇") {
-		return true
+	destFile, err := os.Create(dst)
+	if err != nil {
+		return err
 	}
 
-	return false
-}
-
-// copyFile copies a file
-func copyFile(src, dst string) error {
-	data, err := os.ReadFile(src)
-	if err != nil {
+	if _, err := io.Copy(destFile, sourceFile); err != nil {
+		destFile.Close()
 		return err
 	}
-	return os.WriteFile(dst, data, 0644)
+	// Close flushes the file, its error must not be dropped
+	return destFile.Close()
 }
 
 // Close cleans up resources
@@ -51,12 +51,8 @@ func (p *PDFParser) GetPDFInfo(pdfPath string) (*PDFInfo, error) {
 
 	pageCount := r.NumPage()
 
-	// Check if PDF contains extractable text
-	isTextPDF, err := p.IsTextPDF(pdfPath)
-	if err != nil {
-		// If we can't determine text status, default to false but don't fail
-		isTextPDF = false
-	}
+	// Check if PDF contains extractable text, reusing the reader opened above
+	isTextPDF := hasExtractableText(r)
 
 	return &PDFInfo{
 		FilePath:  pdfPath,
@@ -86,6 +82,11 @@ func (p *PDFParser) IsTextPDF(pdfPath string) (bool, error) {
 	}
 	defer f.Close()
 
+	return hasExtractableText(r), nil
+}
+
+// hasExtractableText reports whether the first pages of an open PDF contain text
+func hasExtractableText(r *pdf.Reader) bool {
 	// Try to extract text from the first few pages
 	// If we can extract any meaningful text, it's a text PDF
 	maxPagesToCheck := 3
@@ -115,13 +116,13 @@ func (p *PDFParser) IsTextPDF(pdfPath string) (bool, error) {
 
 		// If we found enough text, it's definitely a text PDF
 		if totalTextLength > 50 {
-			return true, nil
+			return true
 		}
 	}
 
 	// If we found some text (even a small amount), consider it a text PDF
 	// This handles PDFs with minimal text content
-	return totalTextLength > 0, nil
+	return totalTextLength > 0
 }
 
 
@@ -458,13 +459,12 @@ func determineBlockType(text string, fontSize float64, isBold bool) string {
 	}
 
 	// Check for caption characteristics (typically short, starts with "Figure", "Table", etc.)
-	textLower := strings.ToLower(text)
-	if strings.HasPrefix(textLower, "figure") ||
-		strings.HasPrefix(textLower, "table") ||
-		strings.HasPrefix(textLower, "fig.") ||
-		strings.HasPrefix(textLower, "tab.") ||
-		strings.HasPrefix(textLower, "图") ||
-		strings.HasPrefix(textLower, "表") {
+	if hasPrefixFold(text, "figure") ||
+		hasPrefixFold(text, "table") ||
+		hasPrefixFold(text, "fig.") ||
+		hasPrefixFold(text, "tab.") ||
+		strings.HasPrefix(text, "图") ||
+		strings.HasPrefix(text, "表") {
 		return "caption"
 	}
 
@@ -485,6 +485,32 @@ func determineBlockType(text string, fontSize float64, isBold bool) string {
 	return "paragraph"
 }
 
+// mathSymbolSet holds common mathematical symbols and Greek letters.
+// Built once so formula checks do a map lookup instead of scanning a string per rune.
+var mathSymbolSet = newRuneSet("∫∑∏√∂∇±×÷≤≥≠≈∞∈∉⊂⊃∪∩∧∨¬∀∃αβγδεζηθικλμνξοπρστυφχψω")
+
+// strongMathSymbolSet holds symbols that on their own mark text as a formula
+var strongMathSymbolSet = newRuneSet("∫∑∏√∂∇")
+
+// scriptDigitSet holds superscript and subscript digits (like x² or x₁)
+var scriptDigitSet = newRuneSet("²³⁰¹⁴⁵⁶⁷⁸⁹₀₁₂₃₄₅₆₇₈₉")
+
+// newRuneSet builds a lookup set from the runes of s
+func newRuneSet(s string) map[rune]bool {
+	set := make(map[rune]bool, len(s))
+	for _, r := range s {
+		set[r] = true
+	}
+	return set
+}
+
+// hasPrefixFold reports whether text begins with prefix, ignoring case.
+// prefix must be lower case. Unlike strings.HasPrefix(strings.ToLower(text), prefix)
+// it does not copy the whole text just to look at its first few bytes.
+func hasPrefixFold(text, prefix string) bool {
+	return len(text) >= len(prefix) && strings.EqualFold(text[:len(prefix)], prefix)
+}
+
 // isMathFormula checks if text looks like a mathematical formula
 func isMathFormula(text string) bool {
 	if len(text) == 0 {
@@ -494,9 +520,7 @@ func isMathFormula(text string) bool {
 	// Count mathematical symbols and operators
 	mathSymbolCount := 0
 	totalChars := 0
-	
-	// Common mathematical symbols
-	mathSymbols := "∫∑∏√∂∇±×÷≤≥≠≈∞∈∉⊂⊃∪∩∧∨¬∀∃αβγδεζηθικλμνξοπρστυφχψω"
+	hasStrongSymbol := false
 	
 	for _, r := range text {
 		totalChars++
@@ -508,8 +532,12 @@ func isMathFormula(text string) bool {
 		}
 		
 		// Check for Greek letters and mathematical symbols
-		if strings.ContainsRune(mathSymbols, r) {
+		if mathSymbolSet[r] {
 			mathSymbolCount++
+			// Pattern like "∫f(x)dx" or "∑i=1"
+			if strongMathSymbolSet[r] {
+				hasStrongSymbol = true
+			}
 		}
 		
 		// Check for parentheses, brackets (common in formulas)
@@ -523,31 +551,42 @@ func isMathFormula(text string) bool {
 		return true
 	}
 	
+	// Pattern like "∫f(x)dx" or "∑i=1"
+	if hasStrongSymbol {
+		return true
+	}
+	
+	// The remaining patterns only apply to short text, most prose blocks stop here
+	if len(text) >= 100 {
+		return false
+	}
+	
 	// Check for common formula patterns
 	// Pattern like "x = y + z" or "f(x) = ..."
 	if strings.Contains(text, "=") && (strings.Contains(text, "(") || strings.Contains(text, "+") || strings.Contains(text, "-")) {
 		// Check if it's mostly symbols and numbers with few words
 		wordCount := len(strings.Fields(text))
-		if wordCount <= 5 && len(text) < 100 {
+		if wordCount <= 5 {
 			return true
 		}
 	}
 	
-	// Pattern like "∫f(x)dx" or "∑i=1"
-	if strings.ContainsAny(text, "∫∑∏√∂∇") {
-		return true
-	}
-	
 	// Pattern with lots of subscripts/superscripts indicators
 	underscoreCount := strings.Count(text, "_")
 	caretCount := strings.Count(text, "^")
-	if underscoreCount+caretCount > 2 && len(text) < 100 {
+	if underscoreCount+caretCount > 2 {
 		return true
 	}
 	
 	return false
 }
 
+// headingKeywords are the words a heading may start with (lower case)
+var headingKeywords = []string{
+	"chapter", "section", "appendix", "abstract", "introduction",
+	"conclusion", "references", "bibliography", "acknowledgment",
+}
+
 // isNumberedHeading checks if text looks like a numbered section heading
 func isNumberedHeading(text string) bool {
 	text = strings.TrimSpace(text)
@@ -556,14 +595,8 @@ func isNumberedHeading(text string) bool {
 	}
 
 	// Check for patterns like "1.", "1.1", "1.1.1", "Chapter 1", "Section 1", etc.
-	patterns := []string{
-		"chapter", "section", "appendix", "abstract", "introduction",
-		"conclusion", "references", "bibliography", "acknowledgment",
-	}
-
-	textLower := strings.ToLower(text)
-	for _, pattern := range patterns {
-		if strings.HasPrefix(textLower, pattern) {
+	for _, pattern := range headingKeywords {
+		if hasPrefixFold(text, pattern) {
 			return true
 		}
 	}
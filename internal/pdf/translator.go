@@ -27,6 +27,8 @@ type PDFTranslator struct {
 	currentFile      string
 	status           *PDFStatus
 	textBlocks       []TextBlock
+	blocks           []BabelDocBlock // Blocks extracted by LoadPDF, reused by TranslatePDF
+	pageCount        int             // Page count of the loaded PDF
 	translatedBlocks []TranslatedBlock
 	mu               sync.RWMutex
 	
@@ -140,8 +142,12 @@ func (p *PDFTranslator) LoadPDF(filePath string) (*PDFInfo, error) {
 	// Update status to extracting
 	p.updateStatusLocked(PDFPhaseExtracting, 10, "正在提取文本...")
 
-	// Extract text blocks
-	textBlocks, err := p.parser.ExtractText(filePath)
+	// Extract text blocks with the same extractor the translation uses,
+	// so TranslatePDF can reuse them instead of parsing the PDF again
+	blocks, err := NewBabelDocTranslator(BabelDocConfig{
+		WorkDir: p.workDir,
+		Workers: configExtractWorkers(p.config),
+	}).ExtractBlocks(filePath)
 	if err != nil {
 		logger.Error("failed to extract text", err, logger.String("path", filePath))
 		p.updateStatusLocked(PDFPhaseError, 0, err.Error())
@@ -149,9 +155,29 @@ func (p *PDFTranslator) LoadPDF(filePath string) (*PDFInfo, error) {
 		return nil, err
 	}
 
+	textBlocks := make([]TextBlock, len(blocks))
+	for i, b := range blocks {
+		textBlocks[i] = TextBlock{
+			ID:        b.ID,
+			Page:      b.Page,
+			Text:      b.Text,
+			X:         b.X,
+			Y:         b.Y,
+			Width:     b.Width,
+			Height:    b.Height,
+			FontSize:  b.FontSize,
+			FontName:  b.FontName,
+			IsBold:    b.IsBold,
+			IsItalic:  b.IsItalic,
+			BlockType: b.BlockType,
+		}
+	}
+
 	// Store the extracted text blocks and file path
 	p.currentFile = filePath
 	p.textBlocks = textBlocks
+	p.blocks = blocks
+	p.pageCount = pdfInfo.PageCount
 	p.translatedBlocks = nil
 
 	// Update status to idle (ready for translation)
@@ -189,15 +215,25 @@ func (p *PDFTranslator) TranslatePDF() (*TranslationResult, error) {
 
 	p.updateStatusLocked(PDFPhaseTranslating, 5, "正在准备翻译...")
 	pageCallback := p.pageCompleteCallback
+	blocks := p.blocks
+	pageCount := p.pageCount
+	workers := configExtractWorkers(p.config)
+	finalDelivery := configFinalDelivery(p.config)
 	p.mu.Unlock()
 
 	outputPath := p.generator.GetOutputPath(p.currentFile)
-	babelTranslator := NewBabelDocTranslator(BabelDocConfig{WorkDir: p.workDir})
-
-	// Use go-fitz-based translation with progressive page updates
-	err := babelTranslator.TranslatePDFWithPyMuPDFProgressive(
+	babelTranslator := NewBabelDocTranslator(BabelDocConfig{
+		WorkDir:       p.workDir,
+		Workers:       workers,
+		FinalDelivery: finalDelivery,
+	})
+
+	// Translate the blocks extracted by LoadPDF with progressive page updates
+	err := babelTranslator.TranslateBlocksWithGoPDF2Progressive(
 		p.currentFile,
 		outputPath,
+		blocks,
+		pageCount,
 		p.config.OpenAIAPIKey,
 		p.config.OpenAIBaseURL,
 		p.config.OpenAIModel,
@@ -232,25 +268,20 @@ func (p *PDFTranslator) TranslatePDF() (*TranslationResult, error) {
 		return nil, err
 	}
 
-	// Check page count difference
-	var pageCountResult *PageCountResult
-	if pcResult, err := babelTranslator.CheckPageCountDifference(p.currentFile, outputPath); err != nil {
-		logger.Warn("failed to check page count", logger.Err(err))
-	} else {
-		pageCountResult = pcResult
-	}
-
 	// Validate content completeness (sections, appendices, etc.)
+	// The validation also compares the page counts, so the output is not reopened separately
 	p.mu.Lock()
 	p.status.Message = "正在验证内容完整性..."
 	p.mu.Unlock()
 
+	var pageCountResult *PageCountResult
 	var contentValidation *ContentValidationResult
 	contentValidator := NewContentValidator(p.workDir)
 	if cvResult, err := contentValidator.ValidateContent(p.currentFile, outputPath); err != nil {
 		logger.Warn("failed to validate content completeness", logger.Err(err))
 	} else {
 		contentValidation = cvResult
+		pageCountResult = cvResult.PageCountResult
 		if !cvResult.IsComplete {
 			logger.Warn("content validation detected missing sections",
 				logger.Int("missingSections", len(cvResult.MissingSections)),
@@ -258,6 +289,22 @@ func (p *PDFTranslator) TranslatePDF() (*TranslationResult, error) {
 		}
 	}
 
+	// Fall back to a plain page count check if the validation could not run
+	// (the original page count is known from LoadPDF)
+	if pageCountResult == nil {
+		var pcResult *PageCountResult
+		if pageCount > 0 {
+			pcResult, err = babelTranslator.CheckTranslatedPageCount(pageCount, outputPath)
+		} else {
+			pcResult, err = babelTranslator.CheckPageCountDifference(p.currentFile, outputPath)
+		}
+		if err != nil {
+			logger.Warn("failed to check page count", logger.Err(err))
+		} else {
+			pageCountResult = pcResult
+		}
+	}
+
 	// Update status to complete
 	p.mu.Lock()
 	p.updateStatusLocked(PDFPhaseComplete, 100, "翻译完成")
@@ -482,6 +529,8 @@ func (p *PDFTranslator) Reset() {
 	// Clear state
 	p.currentFile = ""
 	p.textBlocks = nil
+	p.blocks = nil
+	p.pageCount = 0
 	p.translatedBlocks = nil
 	p.status = newIdleStatus()
 
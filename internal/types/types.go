@@ -13,6 +13,8 @@ type Config struct {
 	LastInput       string `json:"last_input"`        // 最后一次输入的 ID/URL/路径
 	InputHistory    []InputHistoryItem `json:"input_history"` // 输入历史记录
 	Concurrency     int    `json:"concurrency"`       // 翻译并发数，用于 LaTeX 和 PDF 翻译的并发批次处理，默认为 3
+	ExtractWorkers  int    `json:"extract_workers"`   // PDF 逐页提取文本的并行 worker 数，默认为 1，最大为 4
+	FinalDelivery   bool   `json:"final_delivery"`    // 最终交付模式：以最高压缩率保存翻译后的 PDF（更慢，文件更小），默认关闭
 	// GitHub 分享配置
 	GitHubToken     string `json:"github_token"`      // GitHub Personal Access Token
 	GitHubOwner     string `json:"github_owner"`      // GitHub 仓库所有者